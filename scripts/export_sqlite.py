@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Export a mailing list JSON database to an indexed SQLite file.
+
+`semlist.py` keeps every database as a single JSON document, which each
+command loads as a whole. This script writes the same data to SQLite, with
+one row per batch and per email and indexes on the batch and the
+(case-insensitive) address, so the list can be queried without
+deserializing it, e.g.:
+
+    SELECT batch_id, COUNT(*) FROM emails GROUP BY batch_id;
+    SELECT * FROM emails WHERE email = 'john@doe.com' COLLATE NOCASE;
+
+The JSON file stays the source of truth; run the export again after changing
+it. Pending journal records are included.
+
+Example:
+    python3 scripts/export_sqlite.py --output dbase/KUMathSeminarMailingList.sqlite3
+"""
+
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+try:
+    import semlist
+except ImportError as exc:  # pragma: no cover
+    print(
+        "Error: Unable to import `semlist`. Please run the script from the "
+        "repository root or adjust PYTHONPATH.",
+        file=sys.stderr,
+    )
+    raise SystemExit(1) from exc
+
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE batches (
+    id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL
+);
+CREATE TABLE emails (
+    id INTEGER PRIMARY KEY,
+    batch_id INTEGER NOT NULL REFERENCES batches (id),
+    position INTEGER NOT NULL,
+    email TEXT NOT NULL,
+    name TEXT,
+    full_entry TEXT,
+    first_name TEXT,
+    middle_names TEXT,
+    last_name TEXT
+);
+CREATE INDEX emails_batch ON emails (batch_id, position);
+CREATE INDEX emails_email ON emails (email COLLATE NOCASE);
+"""
+
+EMAIL_FIELDS = ("name", "full_entry", "first_name", "middle_names", "last_name")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export a mailing list JSON database to SQLite.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--database",
+        type=Path,
+        default=None,
+        help="Path to the mailing list JSON database. Defaults to the active one.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="SQLite file to create. Defaults to the database path with a .sqlite3 suffix.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Overwrite the output file if it already exists.",
+    )
+    return parser.parse_args()
+
+
+def migrate_json_to_sqlite(data: dict, sqlite_path: Path) -> int:
+    """Write the mailing list `data` to a new SQLite file at `sqlite_path`.
+
+    Batches keep their IDs and order (`position`), and emails keep their
+    order within each batch. Returns the number of emails written.
+    """
+    batch_rows = []
+    email_rows = []
+    for position, batch in enumerate(data.get("batches", []), 1):
+        batch_id = batch.get("id", position)
+        batch_rows.append((batch_id, position))
+        email_rows.extend(
+            (batch_id, entry_position, entry["email"])
+            + tuple(entry.get(field) for field in EMAIL_FIELDS)
+            for entry_position, entry in enumerate(batch.get("emails", []), 1)
+        )
+
+    conn = sqlite3.connect(sqlite_path)
+    try:
+        with conn:
+            conn.executescript(SCHEMA)
+            conn.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    (key, data.get(key))
+                    for key in ("name", "created", "last_modified")
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO batches (id, position) VALUES (?, ?)", batch_rows
+            )
+            conn.executemany(
+                "INSERT INTO emails (batch_id, position, email, "
+                + ", ".join(EMAIL_FIELDS)
+                + ") VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                email_rows,
+            )
+    finally:
+        conn.close()
+    return len(email_rows)
+
+
+def main() -> None:
+    args = parse_arguments()
+
+    database_path = (
+        args.database.resolve()
+        if args.database
+        else Path(semlist.get_active_database_path()).resolve()
+    )
+    output_path = args.output or database_path.with_suffix(".sqlite3")
+
+    if output_path.exists() and not args.force:
+        raise SystemExit(
+            f"Error: '{output_path}' already exists. Use --force to overwrite it."
+        )
+
+    data = semlist.read_mailing_list(str(database_path))
+    if not data:
+        raise SystemExit(f"Error: failed to load database '{database_path}'.")
+
+    # Build the export next to the target and swap it in only once it is
+    # complete, so a failed run never destroys a previous export.
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        count = migrate_json_to_sqlite(data, tmp_path)
+        tmp_path.replace(output_path)
+    except (sqlite3.Error, OSError) as exc:
+        tmp_path.unlink(missing_ok=True)
+        raise SystemExit(f"Error: failed to write '{output_path}': {exc}")
+
+    print(
+        f"Exported {count} email(s) in {len(data.get('batches', []))} batch(es) "
+        f"to {output_path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
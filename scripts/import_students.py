@@ -14,10 +14,11 @@ Example:
 from __future__ import annotations
 
 import argparse
+import numbers
 import re
 import sys
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
 try:
     import pandas as pd
@@ -33,6 +34,11 @@ except ImportError as exc:  # pragma: no cover - pandas should be available
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
 
+# Patterns applied per cell are compiled once; `[0-9]` avoids matching the
+# full Unicode digit range that `\d` would.
+_NON_DIGIT_RE = re.compile(r"[^0-9]+")
+_ID_SEPARATORS = str.maketrans("", "", " .-\t\n\r_/\\+")
+
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
@@ -47,6 +53,29 @@ except ImportError as exc:  # pragma: no cover
     raise SystemExit(1) from exc
 
 
+class StudentEntry(NamedTuple):
+    """One contact prepared for import; far lighter than a per-row dict."""
+
+    email: str
+    name: str
+    full_entry: str
+    first_name: str
+    middle_names: str
+    last_name: str
+    row_number: int  # for diagnostics; not persisted
+
+    def to_record(self) -> dict:
+        """Return the mailing-list JSON representation of this entry."""
+        return {
+            "email": self.email,
+            "name": self.name,
+            "full_entry": self.full_entry,
+            "first_name": self.first_name,
+            "middle_names": self.middle_names,
+            "last_name": self.last_name,
+        }
+
+
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Import student contacts from an Excel file.",
@@ -99,6 +128,15 @@ def parse_arguments() -> argparse.Namespace:
         default=10,
         help="Number of sample rows to display in dry-run mode.",
     )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help=(
+            "Only read the first N data rows of the sheet. Handy together with "
+            "--dry-run to sanity-check a large export quickly."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -119,46 +157,62 @@ def resolve_sheet_argument(sheet_arg: Optional[str]) -> Optional[str | int]:
 def excel_column_to_index(column: str) -> int:
     """Convert an Excel column letter (e.g. 'D' or 'AA') to a zero-based index."""
     column = column.upper()
-    if not re.fullmatch(r"[A-Z]+", column):
+    if not column:
         raise ValueError(f"Invalid Excel column reference: '{column}'")
 
+    # Validate while accumulating: one pass, no regex.
     index = 0
     for char in column:
-        index = index * 26 + (ord(char) - ord("A") + 1)
+        offset = ord(char) - 65  # ord("A")
+        if not 0 <= offset < 26:
+            raise ValueError(f"Invalid Excel column reference: '{column}'")
+        index = index * 26 + offset + 1
     return index - 1
 
 
-def select_column(df: pd.DataFrame, spec: str) -> pd.Series:
-    """Return the Series for the column described by `spec`."""
+def build_header_maps(columns: Sequence) -> Tuple[dict, dict]:
+    """Map stripped (and stripped, lowercased) header names to positions."""
+    headers = {}
+    lower_headers = {}
+    for idx, col in enumerate(columns):
+        name = str(col).strip()
+        headers[name] = idx
+        lower_headers[name.lower()] = idx
+    return headers, lower_headers
+
+
+def resolve_column(spec: str, headers: dict, lower_headers: dict, n_cols: int) -> int:
+    """Return the zero-based position of the column described by `spec`.
+
+    Headers are always consulted first, even for letter- or digit-only specs,
+    so a column titled e.g. "ID" is never mistaken for Excel column ID.
+    """
     spec = str(spec).strip()
 
     # Direct header match (case-sensitive to avoid ambiguity)
-    headers = {str(col).strip(): idx for idx, col in enumerate(df.columns)}
     if spec in headers:
-        return df.iloc[:, headers[spec]]
+        return headers[spec]
 
     # Case-insensitive header match
-    lower_headers = {str(col).strip().lower(): idx for idx, col in enumerate(df.columns)}
-    if spec.lower() in lower_headers:
-        return df.iloc[:, lower_headers[spec.lower()]]
+    idx = lower_headers.get(spec.lower())
+    if idx is not None:
+        return idx
 
     # Excel letter reference
-    if re.fullmatch(r"[A-Za-z]+", spec):
+    if spec.isascii() and spec.isalpha():
         idx = excel_column_to_index(spec)
-        try:
-            return df.iloc[:, idx]
-        except IndexError as exc:
+        if idx >= n_cols:
             raise ValueError(
                 f"Column letter '{spec}' (index {idx}) is outside the sheet range."
-            ) from exc
+            )
+        return idx
 
     # Numeric index (allow both positive ints and strings)
-    if re.fullmatch(r"\d+", spec):
+    if spec.isascii() and spec.isdigit():
         idx = int(spec)
-        try:
-            return df.iloc[:, idx]
-        except IndexError as exc:
-            raise ValueError(f"Column index {idx} is outside the sheet range.") from exc
+        if idx >= n_cols:
+            raise ValueError(f"Column index {idx} is outside the sheet range.")
+        return idx
 
     raise ValueError(
         f"Could not resolve column '{spec}'. Use a header name, letter, or index."
@@ -167,121 +221,193 @@ def select_column(df: pd.DataFrame, spec: str) -> pd.Series:
 
 def normalize_student_id(raw_value) -> Optional[str]:
     """Convert the raw student ID cell to a clean string of digits."""
-    if pd.isna(raw_value):
+    # `x != x` only holds for NaN/NaT, which spares a `pd.isna` dispatch per
+    # cell; `pd.NA` has to be tested by identity because it is not boolean.
+    if raw_value is None or raw_value is pd.NA or raw_value != raw_value:
         return None
 
-    if isinstance(raw_value, (int,)):
-        return str(raw_value)
+    # Integral cells (including NumPy integers) are already the ID; floats
+    # (NumPy floats subclass `float`) only need the integer check.
+    if isinstance(raw_value, numbers.Integral):
+        return str(int(raw_value))
 
     if isinstance(raw_value, float):
         if raw_value.is_integer():
             return str(int(raw_value))
-        return re.sub(r"\D+", "", f"{raw_value}")
+        return strip_non_digits(f"{raw_value}")
 
-    value_str = str(raw_value).strip()
-    digits = re.sub(r"\D+", "", value_str)
-    return digits or None
+    return strip_non_digits(str(raw_value).strip()) or None
 
 
-def clean_name(raw_value) -> Optional[str]:
-    if pd.isna(raw_value):
-        return None
-    name = str(raw_value).strip()
-    return name or None
+def strip_non_digits(value: str) -> str:
+    """Remove everything but ASCII digits from `value`."""
+    if value.isascii() and value.isdigit():
+        return value
+
+    # Realistic IDs only carry a few separators; a translate table drops them
+    # without involving the regex engine.
+    digits = value.translate(_ID_SEPARATORS)
+    if digits.isascii() and digits.isdigit():
+        return digits
+    return _NON_DIGIT_RE.sub("", digits)
+
+
+def normalize_student_ids(id_series: pd.Series) -> pd.Series:
+    """Vectorized counterpart of `normalize_student_id` for a whole column.
+
+    Purely numeric columns are converted without leaving pandas; mixed object
+    columns (IDs typed as text, stray separators) fall back to the per-cell
+    normaliser so leading zeros and odd formats are handled identically.
+    """
+    if pd.api.types.is_integer_dtype(id_series):
+        return id_series.astype("string")
+
+    if pd.api.types.is_float_dtype(id_series):
+        ids = id_series.astype("string").str.replace(_NON_DIGIT_RE, "", regex=True)
+        integral = id_series.notna() & (id_series % 1 == 0)
+        ids[integral] = id_series[integral].astype("int64").astype("string")
+        return ids
+
+    return id_series.map(normalize_student_id).astype("string")
 
 
 def build_entries(
     id_series: pd.Series,
     name_series: pd.Series,
     email_domain: str,
-) -> List[dict]:
-    entries: List[dict] = []
-    seen_emails: set[str] = set()
+) -> List[StudentEntry]:
+    frame = pd.DataFrame(
+        {
+            "id": normalize_student_ids(id_series).to_numpy(),
+            "name": name_series.astype("string").str.strip().to_numpy(),
+            "row_number": range(1, len(id_series) + 1),
+        }
+    )
 
-    for row_number, (raw_id, raw_name) in enumerate(zip(id_series, name_series), start=1):
-        student_id = normalize_student_id(raw_id)
-        name = clean_name(raw_name)
+    valid = (frame["id"].str.len() > 0) & (frame["name"].str.len() > 0)
+    frame = frame[valid.fillna(False).astype(bool)]
 
-        if not student_id or not name:
-            continue
+    # Every email shares the same domain, so the digit-only ID is already a
+    # canonical key: no lowercasing or concatenation is needed to dedupe.
+    frame = frame[~frame["id"].duplicated()]
 
-        email = f"{student_id}@{email_domain}"
-        if email.lower() in seen_emails:
-            continue
+    frame["email"] = frame["id"] + f"@{email_domain}"
+    frame["full_entry"] = '"' + frame["name"] + '" <' + frame["email"] + ">;"
 
-        name_parts = semlist.parse_name(name)
+    # Iterate the underlying object arrays rather than boxing every cell
+    # through pandas (`Series.__iter__` or per-row record dicts).
+    emails = frame["email"].to_numpy(dtype=object)
+    names = frame["name"].to_numpy(dtype=object)
+    full_entries = frame["full_entry"].to_numpy(dtype=object)
+    row_numbers = frame["row_number"].tolist()
+    parsed_names = semlist.parse_names(names)
+
+    entries: List[StudentEntry] = []
+    for i in range(len(emails)):
+        name_parts = parsed_names[i]
         entries.append(
-            {
-                "email": email,
-                "name": name,
-                "full_entry": f'"{name}" <{email}>;',
-                "first_name": name_parts.get("first_name", ""),
-                "middle_names": name_parts.get("middle_names", ""),
-                "last_name": name_parts.get("last_name", ""),
-                "_row_number": row_number,  # for diagnostics
-            }
+            StudentEntry(
+                emails[i],
+                names[i],
+                full_entries[i],
+                name_parts.get("first_name", ""),
+                name_parts.get("middle_names", ""),
+                name_parts.get("last_name", ""),
+                row_numbers[i],
+            )
         )
-        seen_emails.add(email.lower())
 
     return entries
 
 
-def load_dataframe(path: Path, sheet: Optional[str | int]) -> pd.DataFrame:
+def load_dataframe(
+    path: Path,
+    sheet: Optional[str | int],
+    column_specs: Sequence[str],
+    nrows: Optional[int] = None,
+) -> Tuple[pd.DataFrame, List[int]]:
+    """Load only the columns described by `column_specs` from the spreadsheet.
+
+    The header row is read first so the specs can be resolved to positions,
+    which are then pushed down to the reader via `usecols`; unused columns are
+    never parsed, and `nrows` stops the reader after that many data rows.
+    Returns the reduced frame together with the position of each requested
+    column inside it.
+    """
+    sheet_name = sheet if sheet is not None else 0
     try:
-        # When sheet is None, pandas returns all sheets as a dict
-        # We want to get the first (default) sheet as a DataFrame
-        if sheet is None:
-            result = pd.read_excel(path)
-        else:
-            result = pd.read_excel(path, sheet_name=sheet)
-        
-        # Handle case where multiple sheets are returned as dict
-        if isinstance(result, dict):
-            # Get the first sheet
-            sheet_name = list(result.keys())[0]
-            return result[sheet_name]
-        
-        return result
+        # The Rust-based calamine reader parses both .xls and .xlsx files far
+        # faster (and with a much smaller footprint) than xlrd/openpyxl.
+        # Opening the workbook explicitly lets us parse only the requested
+        # sheet and release the file handle as soon as we are done.
+        with pd.ExcelFile(path, engine="calamine") as workbook:
+            header = workbook.parse(sheet_name, nrows=0).columns
+            headers, lower_headers = build_header_maps(header)
+            indices = [
+                resolve_column(spec, headers, lower_headers, len(header))
+                for spec in column_specs
+            ]
+            usecols = sorted(set(indices))
+            df = workbook.parse(sheet_name, usecols=usecols, nrows=nrows)
     except (ValueError, ImportError) as exc:
         message = str(exc).lower()
-        if "xlrd" in message:
+        if "calamine" in message:
             print(
-                "Error: pandas requires the 'xlrd' package to read .xls files. "
-                "Install it with `pip install xlrd`.",
+                "Error: pandas requires the 'python-calamine' package to read "
+                "Excel files. Install it with `pip install python-calamine`.",
                 file=sys.stderr,
             )
             raise SystemExit(1) from exc
         raise
 
+    return df, [usecols.index(idx) for idx in indices]
+
+
+def collect_existing_emails(data: dict) -> set[str]:
+    """Return the lowercased emails already stored in the database."""
+    return {
+        entry["email"].lower()
+        for batch in data.get("batches", [])
+        for entry in batch["emails"]
+    }
+
 
 def attach_entries_to_database(
-    entries: Iterable[dict], database_path: Path
+    entries: Iterable[StudentEntry], database_path: Path
 ) -> Tuple[int, int]:
+    """Append `entries` (with lowercase emails) to the database at `database_path`."""
     data = semlist.read_mailing_list(str(database_path))
     if not data:
         raise SystemExit(f"Error: failed to load database '{database_path}'.")
 
     batches = data.setdefault("batches", [])
+    existing = collect_existing_emails(data)
     added = 0
     skipped = 0
 
+    # Keep a cursor on the batch being filled so the loop does not re-index
+    # `batches[-1]` and re-measure it for every entry.
+    current = batches[-1]["emails"] if batches else None
+    current_len = len(current) if current is not None else 0
+
     for entry in entries:
-        email = entry["email"]
-        if semlist.is_email_exists(email, data):
+        email = entry.email
+        if email in existing:
             skipped += 1
             continue
+        existing.add(email)
 
-        # Remove the helper metadata before saving.
-        entry = {k: v for k, v in entry.items() if not k.startswith("_")}
-        if batches and len(batches[-1]["emails"]) < semlist.MAX_EMAILS_PER_BATCH:
-            batches[-1]["emails"].append(entry)
-        else:
+        if current is None or current_len >= semlist.MAX_EMAILS_PER_BATCH:
+            current = []
+            current_len = 0
             batches.append(
                 {
                     "id": len(batches) + 1,
-                    "emails": [entry],
+                    "emails": current,
                 }
             )
+        current.append(entry.to_record())
+        current_len += 1
         added += 1
 
     if added:
@@ -299,15 +425,27 @@ def main() -> None:
     if not args.excel_path.exists():
         raise SystemExit(f"Error: spreadsheet '{args.excel_path}' not found.")
 
-    sheet = resolve_sheet_argument(args.sheet)
-    df = load_dataframe(args.excel_path, sheet)
+    # Emails are `<digits>@<domain>`, so lowercasing the domain once makes
+    # every generated address lowercase and spares a `.lower()` per entry.
+    args.email_domain = args.email_domain.lower()
+
+    if args.limit is not None and args.limit < 1:
+        raise SystemExit("Error: --limit must be a positive number of rows.")
 
+    sheet = resolve_sheet_argument(args.sheet)
     try:
-        id_series = select_column(df, args.id_column)
-        name_series = select_column(df, args.name_column)
+        df, (id_position, name_position) = load_dataframe(
+            args.excel_path,
+            sheet,
+            [args.id_column, args.name_column],
+            nrows=args.limit,
+        )
     except ValueError as exc:
         raise SystemExit(f"Error: {exc}")
 
+    id_series = df.iloc[:, id_position]
+    name_series = df.iloc[:, name_position]
+
     entries = build_entries(id_series, name_series, args.email_domain)
 
     if not entries:
@@ -321,21 +459,23 @@ def main() -> None:
 
     if args.dry_run:
         preview_count = max(args.preview, 0)
-        print(f"[DRY RUN] Prepared {len(entries)} unique entries.")
+        scope = f" from the first {args.limit} row(s)" if args.limit else ""
+        print(f"[DRY RUN] Prepared {len(entries)} unique entries{scope}.")
         if preview_count:
             print("Sample entries:")
             for entry in entries[:preview_count]:
-                print(
-                    f"  Row {entry.get('_row_number')}: "
-                    f"{entry['name']} <{entry['email']}>"
-                )
+                print(f"  Row {entry.row_number}: {entry.name} <{entry.email}>")
         # Report duplicates against existing DB without mutating it.
         data = semlist.read_mailing_list(str(database_path))
         existing = 0
         if data:
-            for entry in entries:
-                if semlist.is_email_exists(entry["email"], data):
-                    existing += 1
+            # `entries` is already de-duplicated, so the size of the overlap
+            # is the number of rows that would be skipped.
+            existing = len(
+                collect_existing_emails(data).intersection(
+                    entry.email for entry in entries
+                )
+            )
 
         print(
             f"Database: {database_path.name} | already present: {existing} "
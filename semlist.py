@@ -28,7 +28,8 @@ Output:
 
 Dependencies:
     - Python 3.x
-    - Standard library only: os, sys, argparse, re, json, pathlib, datetime
+    - Standard library only: os, sys, re, mmap, functools, itertools, types; json, datetime on demand
+    - Optional: orjson (used for faster database reads/writes when installed)
 
 Configuration:
     - All mailing list databases are stored in the 'dbase/' directory (JSON files)
@@ -64,46 +65,147 @@ Usage:
   python3 semlist.py add 'email@example.com'         - Add a single email address
   python3 semlist.py add 'Name <email@example.com>'  - Add an email with a name
   python3 semlist.py add 'Name1 <email1@...>; Name2 <email2@...>' - Add multiple emails
+  python3 semlist.py add - < list.txt                - Add entries read from stdin (one or more per line)
   python3 semlist.py rem email@example.com           - Remove an email address from the database
   python3 semlist.py new DatabaseName                - Create a new database
   python3 semlist.py del DatabaseName                - Delete an existing database (with confirmation)
   python3 semlist.py activate DatabaseName           - Activate an existing database
-  python3 semlist.py optimize                        - Optimize batches (minimize number of batches)
+  python3 semlist.py optimize                        - Optimize batches (minimize batches, drop duplicates)
+  python3 semlist.py optimize all                    - Optimize every database in dbase/
+  python3 semlist.py compact                         - Store the database as compact JSON (faster writes)
+  python3 semlist.py prettify                        - Store the database as indented JSON
   python3 semlist.py config                          - Show current configuration
 """
 
 import os
 import sys
-import argparse
 import re
-import json
-from datetime import datetime
+import mmap
+from functools import lru_cache
+from itertools import islice
+from types import SimpleNamespace
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+    import json
 
 # Constants
 DEFAULT_DATABASE_NAME = "MailingList"
 DATABASE_FOLDER = "dbase"
 CONFIG_FILE = os.path.join(DATABASE_FOLDER, "config.json")
 MAX_EMAILS_PER_BATCH = 57
+# Appended to a database path to name its append-only journal of changes
+JOURNAL_SUFFIX = ".log"
+# Set SEMLIST_DURABLE=1 to flush every database write to disk before returning
+DURABLE_WRITES = os.environ.get("SEMLIST_DURABLE") == "1"
+
+# Regular expressions, compiled once at import time.
+# Basic email pattern (simplified, but covers common cases). Domain labels
+# are separated by single dots, so '.' is not shared between the label class
+# and the separator and the engine has only one way to split the domain.
+_EMAIL_CORE = (
+    r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)*\.[a-zA-Z]{2,}"
+)
+# 'Optional Name <email@addr.com>': group 1 is the name (non-greedy), group 2
+# the email inside angle brackets.
+_NAME_EMAIL_RE = re.compile(r"^(.*?)\s*<(" + _EMAIL_CORE + ")>$")
+# '<email@addr.com>': group 1 is the email.
+_ANGLE_EMAIL_RE = re.compile(r"^<(" + _EMAIL_CORE + ")>$")
+# 'email@addr.com': group 1 is the email.
+_PLAIN_EMAIL_RE = re.compile(r"^(" + _EMAIL_CORE + ")$")
+# Patterns used when reading lines of a text-based mailing list.
+# The lookbehind only lets a match start at the beginning of a run of local
+# part characters. Starting later in the run finds the same '@' and fails or
+# succeeds the same way, so the result is unchanged, but a long run without
+# a valid address is scanned once instead of once per start position.
+_LINE_EMAIL_RE = re.compile(r"(?<![a-zA-Z0-9._%+-])(" + _EMAIL_CORE + ")")
+_LINE_QUOTED_NAME_RE = re.compile(r'"([^"]*)"?\s*<')
+# Command-line arguments that look like negative numbers are positional.
+_NEGATIVE_NUMBER_RE = re.compile(r"^-\d+$|^-\d*\.\d+$")
+# One line of a text database, without surrounding whitespace, as the 'line'
+# group: a '%%%' batch separator, a '#' comment, a well-formed
+# '"Name" <email>;' or 'Name <email>;' entry (qname/name and email groups), or
+# any other text, which goes through the extract_*_from_line helpers.
+# Blank lines do not match.
+_TXT_LINE_RE = re.compile(
+    r"^[^\S\n]*(?P<line>"
+    r"(?P<sep>%%%)"
+    r"|(?P<comment>#[^\n]*?)"
+    r'|(?:"(?P<qname>[^"<>\n]*)"|(?P<name>[^"<>\n]*))'
+    r'[^\S\n]*<(?P<email>[^"<>\n]+)>(?:[^\S\n]*;)?'
+    r"|\S[^\n]*?"
+    r")[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
+# Today's date as stored in the database, computed once per run.
+_TODAY = None
+
+
+def _today():
+    """Return today's date formatted as YYYY-MM-DD."""
+    global _TODAY
+    if _TODAY is None:
+        _TODAY = _timestamp()[:10]
+    return _TODAY
+
+
+def _timestamp():
+    """Return the current date and time formatted as YYYY-MM-DD HH:MM:SS."""
+    # datetime is only needed by commands that write, so it is not imported
+    # at start-up
+    from datetime import datetime
+
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Parsed contents of CONFIG_FILE, loaded on first use and kept in step with
+# save_config so a CLI run reads the file at most once.
+_CONFIG_CACHE = None
 
 
 def ensure_config_exists():
     """Ensure the configuration file exists."""
-    if not os.path.exists(DATABASE_FOLDER):
-        os.makedirs(DATABASE_FOLDER, exist_ok=True)
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is not None:
+        return dict(_CONFIG_CACHE)
 
-    if not os.path.exists(CONFIG_FILE):
-        config = {"active_database": f"{DEFAULT_DATABASE_NAME}.json"}
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
-        return config
-    return get_config()
+    # Opening the file directly costs one syscall; probing with os.path.exists
+    # first would add a stat() to every run.
+    try:
+        with open(CONFIG_FILE, "rb") as f:
+            _CONFIG_CACHE = json_loads(f.read())
+        return dict(_CONFIG_CACHE)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Unreadable or malformed: get_config reports it and returns the default
+        return get_config()
+
+    os.makedirs(DATABASE_FOLDER, exist_ok=True)
+    config = {"active_database": f"{DEFAULT_DATABASE_NAME}.json"}
+    write_json_file(CONFIG_FILE, config)
+    _CONFIG_CACHE = config
+    return dict(config)
 
 
 def get_config():
-    """Get the configuration."""
+    """Get the configuration.
+
+    Returns a copy of the cached configuration, so callers may modify it
+    before passing it to `save_config`.
+    """
+    global _CONFIG_CACHE
+    if _CONFIG_CACHE is not None:
+        return dict(_CONFIG_CACHE)
+
     try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
+        with open(CONFIG_FILE, "rb") as f:
+            _CONFIG_CACHE = json_loads(f.read())
+        return dict(_CONFIG_CACHE)
     except Exception as e:
         print(f"Error reading configuration: {str(e)}")
         # Ensure we return the default if reading fails
@@ -112,17 +214,25 @@ def get_config():
 
 def save_config(config):
     """Save the configuration."""
+    global _CONFIG_CACHE
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        write_json_file(CONFIG_FILE, config)
+        _CONFIG_CACHE = dict(config)
+        get_active_database_path.cache_clear()
         return True
     except Exception as e:
+        # The write is atomic, so the cached config still matches the file
         print(f"Error saving configuration: {str(e)}")
         return False
 
 
+@lru_cache(maxsize=1)
 def get_active_database_path():
-    """Get the active database path."""
+    """Get the active database path.
+
+    The result is cached for the rest of the run; `save_config` clears it
+    whenever the active database changes.
+    """
     config = ensure_config_exists()
     active_db = config.get("active_database", f"{DEFAULT_DATABASE_NAME}.json")
 
@@ -132,68 +242,86 @@ def get_active_database_path():
     return os.path.join(DATABASE_FOLDER, db_filename)
 
 
+# Database file names in DATABASE_FOLDER, as `(folder mtime, names)`.
+_DB_LIST_CACHE = None
+
+
+def list_databases():
+    """Return the names of the database files in DATABASE_FOLDER.
+
+    The listing is taken with os.scandir, whose entries carry their file type
+    so directories are skipped without a stat per entry, and reused for as
+    long as the folder's modification time is unchanged.
+    """
+    global _DB_LIST_CACHE
+    mtime = os.stat(DATABASE_FOLDER).st_mtime_ns
+    if _DB_LIST_CACHE is None or _DB_LIST_CACHE[0] != mtime:
+        with os.scandir(DATABASE_FOLDER) as it:
+            names = [
+                entry.name
+                for entry in it
+                if entry.name.endswith(".json")
+                and entry.name != "config.json"
+                and entry.is_file()
+            ]
+        _DB_LIST_CACHE = (mtime, names)
+    return list(_DB_LIST_CACHE[1])
+
+
 def parse_arguments():
-    """Parse command-line arguments using argparse.
+    """Parse command-line arguments.
 
-    Uses a custom approach to handle the 'help' command and its aliases
-    ('-h', '--help') *before* involving argparse. This ensures that the
-    custom `display_help` function (which prints the main docstring) is called
-    for help requests, providing more detailed and formatted help than
-    argparse's default.
+    The help command and its aliases ('-h', '--help') are handled first, so
+    that the custom `display_help` function (which prints the main docstring)
+    is called for help requests.
 
-    For all other commands, it uses argparse to identify the main command
-    and collect any subsequent arguments associated with it.
+    Every command takes only positional arguments, so the command line is
+    split by hand rather than through argparse, which would cost more to
+    import and set up than the whole parse. Option-looking arguments are
+    rejected the way argparse would: anything starting with '-' other than a
+    lone '-', a negative number, or a string containing a space, unless it
+    comes after a '--' separator.
 
     Returns:
-        argparse.Namespace: An object containing the parsed command and its arguments.
+        types.SimpleNamespace: An object containing the parsed command and its arguments.
                              - command (str): The main command entered by the user
                                (e.g., 'print', 'add', 'check').
                              - args (list): A list of strings representing all
                                arguments that followed the main command.
     """
+    argv = sys.argv[1:]
+
     # --- Manual Help Check --- Priority handling for help requests.
-    # Check if the second argument (index 1) is one of the help flags.
-    # sys.argv[0] is the script name itself.
-    if len(sys.argv) > 1 and sys.argv[1] in ["-h", "--help", "help"]:
+    # Also show help if the script is run without commands.
+    if not argv or argv[0] in ("-h", "--help", "help"):
         display_help()  # Call our custom help display function.
         sys.exit(0)  # Exit cleanly after displaying help.
 
-    # --- Argparse for Other Commands ---
-    # Initialize ArgumentParser. `add_help=False` disables argparse's automatic
-    # -h/--help handling, as we've already handled it manually.
-    parser = argparse.ArgumentParser(
-        description="Command-line tool to manage the KU Math Seminar mailing list.",
-        add_help=False,
-    )
-    # Define the mandatory 'command' positional argument.
-    parser.add_argument(
-        "command",
-        help="The primary action to perform (e.g., print, add, check, new, etc.)",
-    )
-    # Define 'args' to capture all remaining positional arguments.
-    # `nargs="*"` means it accepts zero or more arguments and collects them into a list.
-    parser.add_argument(
-        "args", nargs="*", help="Additional arguments required by the specific command."
-    )
-
-    # --- Handle No Command Case ---
-    # If the script is called with no arguments other than its name.
-    if len(sys.argv) == 1:
-        display_help()  # Show help if the script is run without commands.
-        sys.exit(0)  # Exit cleanly.
-
-    # --- Parse Arguments ---
-    try:
-        # Let argparse parse the command line arguments based on the definitions above.
-        parsed_args = parser.parse_args()
-        return parsed_args
-    except SystemExit:
-        # This block might be reached if argparse encounters an error it can't handle
-        # (though less likely with this simple setup). It prevents argparse from
-        # exiting the script directly. We display our help and exit with an error code.
+    # --- Collect Positional Arguments ---
+    positional = []
+    options_ended = False
+    for arg in argv:
+        if not options_ended:
+            if arg == "--":
+                options_ended = True
+                continue
+            if (
+                arg.startswith("-")
+                and arg != "-"
+                and " " not in arg
+                and not _NEGATIVE_NUMBER_RE.match(arg)
+            ):
+                # Unknown option: show our help and exit with an error code.
+                display_help()
+                sys.exit(1)
+        positional.append(arg)
+
+    if not positional:
         display_help()
         sys.exit(1)  # Exit with a non-zero code indicating an error.
 
+    return SimpleNamespace(command=positional[0], args=positional[1:])
+
 
 def display_help():
     """Display the detailed help message from the module's main docstring."""
@@ -248,46 +376,12 @@ def parse_email_entries(args_list):
     # Split the combined string by semicolons (;), but only if the semicolon is
     # *outside* of angle brackets (<...>). This prevents splitting email addresses
     # like '<local-part;@domain.com>'.
-    entries = []
-    current_entry = ""
-    in_angle_brackets = False  # Flag to track if we are inside angle brackets.
-    for char in input_str:
-        if char == "<":
-            in_angle_brackets = True
-        elif char == ">":
-            in_angle_brackets = False
-
-        # Check for semicolon separator only when not inside angle brackets.
-        if char == ";" and not in_angle_brackets:
-            # If a semicolon separator is found, add the accumulated entry
-            # (if not empty after stripping whitespace) to the list.
-            if current_entry.strip():
-                entries.append(current_entry.strip())
-            current_entry = ""  # Reset to start accumulating the next entry.
-        else:
-            # Append the character to the current entry being built.
-            current_entry += char
-
-    # After the loop, add the last accumulated entry (if any).
-    if current_entry.strip():
-        entries.append(current_entry.strip())
+    entries = split_entries(input_str)
 
     # --- Step 2: Parse Individual Entries ---
+    # The patterns for the supported formats are compiled at module level
+    # (_NAME_EMAIL_RE, _ANGLE_EMAIL_RE, _PLAIN_EMAIL_RE).
     parsed_entries = []
-    # Define regular expressions for matching different email formats.
-    # Basic email pattern (simplified, but covers common cases).
-    email_pattern_core = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    # Pattern 1: Matches 'Optional Name <email@addr.com>'. Captures name and email.
-    # - `^`: Start of string.
-    # - `(.*?)`: Capture group 1: Any characters non-greedily (for the name).
-    # - `\s*`: Zero or more whitespace characters.
-    # - `<(` + email_pattern_core + `)>`: Capture group 2: The email address inside angle brackets.
-    # - `$`: End of string.
-    name_email_pattern = re.compile(r"^(.*?)\s*<(" + email_pattern_core + ")>$")
-    # Pattern 2: Matches '<email@addr.com>'. Captures email.
-    angle_email_pattern = re.compile(r"^<(" + email_pattern_core + ")>$")
-    # Pattern 3: Matches 'email@addr.com'. Captures email.
-    plain_email_pattern = re.compile(r"^(" + email_pattern_core + ")$")
 
     # Iterate through the strings extracted in Step 1.
     for entry_text in entries:
@@ -298,7 +392,7 @@ def parse_email_entries(args_list):
 
         # Attempt to match each pattern in order of complexity.
         # 1. Check for 'Name <email>' format.
-        match = name_email_pattern.match(entry)
+        match = _NAME_EMAIL_RE.match(entry)
         if match:
             # Group 1 is the name part, group 2 is the email.
             full_name = match.group(1).strip(" '\"")  # Clean quotes/spaces from name.
@@ -318,7 +412,7 @@ def parse_email_entries(args_list):
             continue  # Successfully parsed, move to the next entry string.
 
         # 2. Check for '<email>' format.
-        match = angle_email_pattern.match(entry)
+        match = _ANGLE_EMAIL_RE.match(entry)
         if match:
             # Group 1 is the email.
             email = match.group(1).strip()
@@ -336,7 +430,7 @@ def parse_email_entries(args_list):
             continue  # Parsed successfully.
 
         # 3. Check for plain 'email' format.
-        match = plain_email_pattern.match(entry)
+        match = _PLAIN_EMAIL_RE.match(entry)
         if match:
             # Group 1 is the email.
             email = match.group(1).strip()
@@ -363,6 +457,48 @@ def parse_email_entries(args_list):
     return parsed_entries
 
 
+def split_entries(input_str):
+    """Split a string of entries on semicolons that are outside angle brackets.
+
+    The string is split with str.split(";") and only fragments left with an
+    unclosed '<' are glued back to the following fragment, so well-formed input
+    never leaves the C-level split.
+
+    Args:
+        input_str (str): Semicolon-separated entries.
+
+    Returns:
+        list: The non-empty entries, stripped of surrounding whitespace.
+    """
+    entries = []
+    pending = []  # Fragments inside a '<...>' still waiting for its '>'.
+    for part in input_str.split(";"):
+        if pending:
+            pending.append(part)
+            # Still open unless this fragment has a '>' after its last '<'
+            if part.rfind("<") >= part.rfind(">"):
+                continue
+            part = ";".join(pending)
+            pending = []
+        # Every split point is outside brackets, so the last bracket seen
+        # decides whether this fragment ends inside '<...>'.
+        elif part.rfind("<") > part.rfind(">"):
+            pending.append(part)
+            continue
+        part = part.strip()
+        if part:
+            entries.append(part)
+
+    # Fragments are joined once rather than concatenated per ';', which
+    # would be quadratic for a long run of semicolons after an unclosed '<'.
+    if pending:
+        part = ";".join(pending).strip()
+        if part:
+            entries.append(part)
+
+    return entries
+
+
 def parse_name(full_name):
     """Parse a full name string into first, middle, and last name components.
 
@@ -380,11 +516,27 @@ def parse_name(full_name):
               - 'middle_names' (str): Contains all middle parts joined by space, or empty.
               - 'last_name' (str)
     """
+    first_name, middle_names, last_name = _split_name(full_name)
+    return {
+        "first_name": first_name,
+        "middle_names": middle_names,
+        "last_name": last_name,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _split_name(full_name):
+    """Split a full name into a `(first, middle, last)` tuple for `parse_name`.
+
+    Cached because the same names come up again and again (re-added people,
+    duplicate lines, whole rosters). Returns a tuple so that callers can never
+    modify a cached result.
+    """
     # Clean the input name: remove leading/trailing whitespace and quotes.
     name = full_name.strip(" '\"")
     # If the name is empty after cleaning, return empty components.
     if not name:
-        return {"first_name": "", "middle_names": "", "last_name": ""}
+        return ("", "", "")
 
     # Split the cleaned name into parts based on spaces.
     name_parts = name.split()
@@ -393,23 +545,35 @@ def parse_name(full_name):
     # Determine components based on the number of parts.
     if num_parts == 1:
         # Assume a single part is the first name.
-        return {"first_name": name_parts[0], "middle_names": "", "last_name": ""}
+        return (name_parts[0], "", "")
     elif num_parts == 2:
         # Assume two parts are first and last name.
-        return {
-            "first_name": name_parts[0],
-            "middle_names": "",
-            "last_name": name_parts[1],
-        }
+        return (name_parts[0], "", name_parts[1])
     else:  # 3 or more parts
         # Assume the first part is the first name,
         # the last part is the last name,
         # and everything in between constitutes the middle name(s).
-        return {
-            "first_name": name_parts[0],
-            "middle_names": " ".join(name_parts[1:-1]),  # Join middle parts with space.
-            "last_name": name_parts[-1],
-        }
+        return (
+            name_parts[0],
+            " ".join(name_parts[1:-1]),  # Join middle parts with space.
+            name_parts[-1],
+        )
+
+
+def parse_names(full_names):
+    """Parse many full names at once into first, middle, and last components.
+
+    Bulk counterpart of `parse_name` for importers that handle whole rosters.
+    Repeated names are served from the `parse_name` cache.
+
+    Args:
+        full_names (iterable): Full name strings, in order.
+
+    Returns:
+        list: One component dictionary (as returned by `parse_name`) per input
+              name, in the same order. Repeated names receive independent copies.
+    """
+    return [parse_name(full_name) for full_name in full_names]
 
 
 def convert_txt_to_json(txt_path, json_path=None):
@@ -417,56 +581,75 @@ def convert_txt_to_json(txt_path, json_path=None):
     if json_path is None:
         json_path = txt_path.replace(".txt", ".json")
 
-    if not os.path.exists(txt_path):
+    try:
+        txt_file = open(txt_path, "r")
+    except FileNotFoundError:
         print(f"Error: Text database file '{txt_path}' does not exist.")
         return False
+    except OSError as e:
+        print(f"Error converting text to JSON: {str(e)}")
+        return False
 
     batches = []
     current_batch = []
 
     try:
-        with open(txt_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                if line == "%%%":
-                    if current_batch:
-                        batches.append(current_batch)
-                        current_batch = []
-                else:
-                    email = extract_email_from_line(line)
-                    name = extract_name_from_line(line)
-                    if email:
-                        name_components = parse_name(name)
-                        current_batch.append(
-                            {
-                                "email": email,
-                                "name": name,
-                                "full_entry": line,
-                                **name_components,
-                            }
-                        )
-
-            # Add the last batch if it's not empty
-            if current_batch:
-                batches.append(current_batch)
+        with txt_file as f:
+            text = f.read()
+
+        # A single regex scan classifies every line of the file; Python code
+        # only runs for the lines that matched.
+        for match in _TXT_LINE_RE.finditer(text):
+            if match.group("sep") is not None:
+                if current_batch:
+                    batches.append(current_batch)
+                    current_batch = []
+                continue
+            if match.group("comment") is not None:
+                continue
+
+            line = match.group("line")
+            if match.group("email") is not None:
+                email = match.group("email").strip()
+                name = match.group("qname")
+                if name is None:
+                    name = match.group("name").strip()
+                    if name.endswith(";"):
+                        name = name[:-1]
+                name = name.strip()
+            else:
+                email = extract_email_from_line(line)
+                name = extract_name_from_line(line)
+            if email:
+                name_components = parse_name(name)
+                current_batch.append(
+                    {
+                        "email": email,
+                        "name": name,
+                        "full_entry": line,
+                        **name_components,
+                    }
+                )
+
+        # Add the last batch if it's not empty
+        if current_batch:
+            batches.append(current_batch)
 
         # Create JSON structure
         json_data = {
             "name": "KU Math Seminar",
-            "created": datetime.now().strftime("%Y-%m-%d"),
-            "last_modified": datetime.now().strftime("%Y-%m-%d"),
+            "created": _today(),
+            "last_modified": _today(),
             "batches": [],
         }
 
         for i, batch_emails in enumerate(batches, 1):
             json_data["batches"].append({"id": i, "emails": batch_emails})
 
-        # Write JSON data
-        with open(json_path, "w") as f:
-            json.dump(json_data, f, indent=2)
+        # Write JSON data in a single call rather than token by token
+        write_json_file(json_path, json_data)
+        # A journal left from an earlier file at this path no longer applies
+        discard_journal(json_path)
 
         print(f"Successfully converted '{txt_path}' to JSON format at '{json_path}'.")
         return True
@@ -481,18 +664,13 @@ def show_statistics(database_path=None):
     if database_path is None:
         database_path = get_active_database_path()
 
-    data = read_mailing_list(database_path)
+    data = _cached_read(database_path)
     if not data:
         return False
 
     # Calculate statistics
-    total_emails = 0
-    batch_stats = []
-
-    for batch in data["batches"]:
-        batch_count = len(batch["emails"])
-        total_emails += batch_count
-        batch_stats.append({"id": batch["id"], "count": batch_count})
+    counts = [len(batch["emails"]) for batch in data["batches"]]
+    total_emails = sum(counts)
 
     # Display statistics
     print(f"Database: {data.get('name', 'Unknown')}")
@@ -501,66 +679,117 @@ def show_statistics(database_path=None):
     print(f"Number of batches: {len(data['batches'])}")
     print("\nEmails per batch:")
 
-    for batch in batch_stats:
-        print(f"  Batch {batch['id']}: {batch['count']} emails")
+    print_lines(
+        [
+            f"  Batch {batch['id']}: {count} emails"
+            for batch, count in zip(data["batches"], counts)
+        ]
+    )
 
     return True
 
 
-def remove_email(email, database_path=None):
-    """Remove an email from the database."""
-    if database_path is None:
-        database_path = get_active_database_path()
+def remove_email(email, database_path=None, session=None):
+    """Remove an email from the database.
 
-    data = read_mailing_list(database_path)
+    If `session` (a DatabaseSession) is given, its in-memory data is modified
+    and written when the session closes instead of re-reading the database
+    and journaling the removal.
+    """
+    if session is not None:
+        data = session.data
+    else:
+        if database_path is None:
+            database_path = get_active_database_path()
+        data = read_mailing_list(database_path)
     if not data:
         return False
 
-    email_found = False
     email = email.lower()  # Convert to lowercase for case-insensitive comparison
 
-    # Search through all batches for the email
-    for batch in data["batches"]:
-        for i, entry in enumerate(batch["emails"]):
-            if entry["email"].lower() == email:
-                removed_entry = batch["emails"].pop(i)
-                email_found = True
-                name = removed_entry.get("name", "")
-                if name:
-                    print(
-                        f"Email '{name} <{email}>' has been removed from the database."
-                    )
-                else:
-                    print(f"Email '{email}' has been removed from the database.")
-                break
-        if email_found:
-            break
-
-    if not email_found:
+    removed_entry = drop_entry(data, email)
+    if removed_entry is None:
         print(f"Email '{email}' was not found in the database.")
         return False
 
-    # Remove any empty batches
-    data["batches"] = [batch for batch in data["batches"] if batch["emails"]]
+    if session is not None:
+        session.dirty = True
+    # Record the removal in the journal instead of rewriting the file
+    elif not append_to_journal(
+        [{"op": "rem", "date": _today(), "email": email}], database_path
+    ):
+        return False
 
-    # Renumber batch IDs to ensure they are consecutive
-    for i, batch in enumerate(data["batches"], 1):
-        batch["id"] = i
+    name = removed_entry.get("name", "")
+    if name:
+        print(f"Email '{name} <{email}>' has been removed from the database.")
+    else:
+        print(f"Email '{email}' has been removed from the database.")
+    if session is None:
+        compact_journal_if_large(data, database_path)
+    return True
 
-    if write_mailing_list(data, database_path):
-        return True
+
+def drop_entry(data, email):
+    """Remove the entry for lowercased `email` from `data` and return it.
+
+    If its batch is left empty, the batch is dropped and the remaining ones
+    renumbered. Returns None if the email is not in the database.
+    """
+    # Look the email up in the index instead of scanning every batch
+    index = get_email_index(data)
+    location = index.get(email)
+    if location is None:
+        return None
+
+    batch_idx, entry_idx = location
+    batches = data["batches"]
+    emails = batches[batch_idx]["emails"]
+    removed_entry = emails[entry_idx]
+    del emails[entry_idx]
+
+    if not emails:
+        # Only a batch that became empty changes the batch list; drop it and
+        # renumber the batch IDs so they stay consecutive. Every later batch
+        # has moved, so the index is rebuilt on next use.
+        del batches[batch_idx]
+        for i, batch in enumerate(batches, 1):
+            batch["id"] = i
+        invalidate_email_index(data)
+    elif data.get("_email_duplicates"):
+        # A later entry with the same address must now be found instead
+        invalidate_email_index(data)
     else:
-        return False
+        # Only the entries after the removed one, in the same batch, moved;
+        # updating them keeps a series of removals (e.g. a journal replay)
+        # from rebuilding the whole index each time
+        del index[email]
+        for i in range(entry_idx, len(emails)):
+            address = emails[i].get("email")
+            if address:
+                index[address.lower()] = (batch_idx, i)
+    return removed_entry
 
 
 def extract_email_from_line(line):
     """Extract the email address from a line."""
-    match = re.search(r"<([^>]+)>", line)
-    if match:
-        return match.group(1).strip()
-
-    # If no <> format, try to find an email pattern
-    match = re.search(r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})", line)
+    # The text between the first '<' that has a non-empty '<...>' after it
+    # and the next '>', found with str.find instead of the regex engine.
+    start = line.find("<")
+    while start != -1:
+        end = line.find(">", start + 1)
+        if end == -1:
+            break
+        if end > start + 1:
+            return line[start + 1 : end].strip()
+        start = line.find("<", end)
+
+    # If no <> format, try to find an email pattern; a line without an '@'
+    # cannot contain one, which the C-level 'in' test finds much faster than
+    # a regex scan of the whole line
+    if "@" not in line:
+        return None
+    match = _LINE_EMAIL_RE.search(line)
     if match:
         return match.group(1).strip()
 
@@ -570,14 +799,16 @@ def extract_email_from_line(line):
 def extract_name_from_line(line):
     """Extract the name from a line."""
     # Check for "Name" <email> format
-    match = re.search(r'"([^"]*)"?\s*<', line)
-    if match:
-        return match.group(1).strip()
+    if '"' in line:
+        match = _LINE_QUOTED_NAME_RE.search(line)
+        if match:
+            return match.group(1).strip()
 
-    # Check for Name <email> format without quotes
-    match = re.search(r"^([^<]+)<", line)
-    if match:
-        name = match.group(1).strip()
+    # Check for Name <email> format without quotes: the text before the
+    # first '<', if any
+    name, bracket, _ = line.partition("<")
+    if bracket and name:
+        name = name.strip()
         if name.endswith(";"):
             name = name[:-1].strip()
         return name
@@ -590,19 +821,317 @@ def read_mailing_list(database_path=None):
     if database_path is None:
         database_path = get_active_database_path()
 
-    if not os.path.exists(database_path):
+    try:
+        data = read_json_file(database_path)
+        return replay_journal(data, database_path)
+    except FileNotFoundError:
         print(f"Error: Database file '{database_path}' does not exist.")
         return None
-
-    try:
-        with open(database_path, "r") as f:
-            data = json.load(f)
-        return data
     except Exception as e:
         print(f"Error reading database: {str(e)}")
         return None
 
 
+# Parsed databases for the read-only commands, as `{path: (stamp, data)}`.
+# Cleared by every write to a database or its journal.
+_DB_CACHE = {}
+
+
+def _database_stamp(database_path):
+    """Return the (mtime, size) of a database and of its journal, if any."""
+    st = os.stat(database_path)
+    try:
+        jst = os.stat(journal_path(database_path))
+        journal = (jst.st_mtime_ns, jst.st_size)
+    except FileNotFoundError:
+        journal = None
+    return (st.st_mtime_ns, st.st_size, journal)
+
+
+def _cached_read(database_path=None):
+    """Read the mailing list like `read_mailing_list`, parsing it at most once.
+
+    The parsed data is reused for as long as the stamps of the database and
+    its journal are unchanged. It is shared between callers, so only use it
+    for commands that do not modify the data.
+    """
+    if database_path is None:
+        database_path = get_active_database_path()
+
+    try:
+        stamp = _database_stamp(database_path)
+    except OSError:
+        return read_mailing_list(database_path)  # Reports the error
+
+    cached = _DB_CACHE.get(database_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    data = read_mailing_list(database_path)
+    if data:
+        _DB_CACHE[database_path] = (stamp, data)
+    return data
+
+
+def get_email_index(data):
+    """Return a `{lowercased email: (batch index, entry index)}` lookup for `data`.
+
+    The index is built on first use and cached under the runtime-only
+    `_email_index` key, which is never written to disk; `_email_duplicates`
+    records whether some address occurs more than once. Appending
+    (`place_entry`, `place_entries`) and `drop_entry` keep the index up to
+    date; other code that moves or removes entries must call
+    `invalidate_email_index` afterwards.
+    """
+    index = data.get("_email_index")
+    if index is None:
+        index = {}
+        count = 0
+        for batch_idx, batch in enumerate(data.get("batches", [])):
+            for entry_idx, entry in enumerate(batch.get("emails", [])):
+                email = entry.get("email")
+                if email:
+                    # Keep the first occurrence, matching a front-to-back scan
+                    index.setdefault(email.lower(), (batch_idx, entry_idx))
+                    count += 1
+        data["_email_index"] = index
+        data["_email_duplicates"] = len(index) < count
+    return index
+
+
+def invalidate_email_index(data):
+    """Drop the cached email index after `data["batches"]` has been reshaped."""
+    data.pop("_email_index", None)
+    data.pop("_email_duplicates", None)
+
+
+def json_loads(raw):
+    """Parse JSON from bytes (or str), using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_json_file(path):
+    """Load a JSON document from `path`.
+
+    With orjson the file is memory-mapped and parsed straight from the page
+    cache instead of being copied into a bytes object first. Empty files,
+    which cannot be mapped, are read normally.
+
+    A document written without indentation is flagged with a runtime-only
+    `_compact` key so that `write_json_file` keeps it compact.
+    """
+    with open(path, "rb") as f:
+        data = None
+        if orjson is not None:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                mapped = None
+            if mapped is not None:
+                with mapped, memoryview(mapped) as view:
+                    data = orjson.loads(view)
+                    head = mapped[1:2]
+        if data is None:
+            raw = f.read()
+            data = json_loads(raw)
+            head = raw[1:2]
+    if isinstance(data, dict) and head and not head.isspace():
+        data["_compact"] = True
+    return data
+
+
+def write_json_file(path, obj):
+    """Write `obj` as JSON to `path`, replacing the file atomically.
+
+    The data goes to a temporary file next to `path` which is then renamed
+    over it with os.replace, so an interrupted write never leaves a truncated
+    database or config behind. The data is only synced to disk when
+    SEMLIST_DURABLE=1 is set (see `sync_file`).
+    """
+    _DB_CACHE.clear()
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps(obj))
+            sync_file(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def sync_file(f):
+    """Flush the open file `f` to disk if durable writes are enabled.
+
+    fdatasync is used where available: it skips the metadata (timestamps)
+    flush that fsync adds and is enough for the replace-based writes here.
+    """
+    if DURABLE_WRITES:
+        f.flush()
+        if hasattr(os, "fdatasync"):
+            os.fdatasync(f.fileno())
+        else:
+            os.fsync(f.fileno())
+
+
+def json_dumps(obj):
+    """Serialize `obj` to the UTF-8 encoded JSON stored on disk.
+
+    orjson produces the same 2-space layout as `json.dumps(obj, indent=2)`
+    several times faster; the stdlib encoder is used when it is missing.
+    When `obj` carries a true `_compact` flag (see `read_json_file` and the
+    `compact` command) the indentation is skipped, which makes the output
+    smaller and cheaper to produce. Top-level keys starting with an
+    underscore hold runtime caches and are left out.
+    """
+    compact = obj.get("_compact", False)
+    if any(key.startswith("_") for key in obj):
+        obj = {key: value for key, value in obj.items() if not key.startswith("_")}
+    if orjson is not None:
+        if compact:
+            return orjson.dumps(obj)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if compact:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def journal_path(database_path):
+    """Return the path of the journal kept next to a database file."""
+    return database_path + JOURNAL_SUFFIX
+
+
+def append_to_journal(records, database_path=None):
+    """Append change records to the database's journal instead of rewriting it.
+
+    Each record is written as one compact JSON line, e.g.
+    `{"op": "add", "date": "2024-04-04", "entry": {...}}` or
+    `{"op": "rem", "date": "2024-04-04", "email": "..."}`, so adding or
+    removing an email costs a single append regardless of the size of the
+    database. The journal is replayed by `read_mailing_list` and folded into
+    the main file by the next full write (`write_mailing_list`, e.g. on
+    optimize).
+    """
+    if database_path is None:
+        database_path = get_active_database_path()
+
+    if orjson is not None:
+        lines = [orjson.dumps(record) for record in records]
+    else:
+        lines = [
+            json.dumps(record, separators=(",", ":")).encode("utf-8")
+            for record in records
+        ]
+
+    _DB_CACHE.clear()
+    try:
+        with open(journal_path(database_path), "a+b") as f:
+            _trim_partial_record(f)
+            f.write(b"\n".join(lines) + b"\n")
+            sync_file(f)
+        return True
+    except Exception as e:
+        print(f"Error writing to database: {str(e)}")
+        return False
+
+
+def _trim_partial_record(f):
+    """Cut a partial last line, left by an interrupted append, off journal `f`.
+
+    Without this the next record would be written onto the end of the
+    partial one and the merged line could not be read back. `f` is open in
+    'a+b' mode; the file is only read when it does not end with a newline.
+    """
+    end = f.seek(0, os.SEEK_END)
+    if not end:
+        return
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return
+    # Search backwards, a block at a time, for the end of the last record
+    pos = end
+    while pos > 0:
+        start = max(0, pos - 4096)
+        f.seek(start)
+        newline = f.read(pos - start).rfind(b"\n")
+        if newline != -1:
+            f.truncate(start + newline + 1)
+            return
+        pos = start
+    f.truncate(0)
+
+
+def replay_journal(data, database_path):
+    """Apply the records of the database's journal, if any, to `data`.
+
+    A record that cannot be decoded is reported and skipped, so one damaged
+    line does not make the database and the other records unreadable.
+    """
+    try:
+        with open(journal_path(database_path), "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return data
+
+    # Every complete record ends with a newline; anything after the last one
+    # is a partial line left by an interrupted append and is ignored.
+    for line in raw.split(b"\n")[:-1]:
+        if not line:
+            continue
+        try:
+            record = json_loads(line)
+        except ValueError:
+            print(
+                f"Warning: skipping an unreadable record in journal "
+                f"'{journal_path(database_path)}'."
+            )
+            continue
+        if record["op"] == "add":
+            place_entry(data, record["entry"])
+        elif record["op"] == "rem":
+            drop_entry(data, record["email"])
+        data["last_modified"] = record.get("date", data.get("last_modified"))
+    return data
+
+
+def discard_journal(database_path):
+    """Delete the database's journal once its records are in the main file."""
+    _DB_CACHE.clear()
+    try:
+        os.remove(journal_path(database_path))
+    except FileNotFoundError:
+        pass
+
+
+def compact_journal_if_large(data, database_path):
+    """Fold the journal into the database once it outgrows the database file.
+
+    `data` must be the database as read with its journal replayed. Rewriting
+    only when the journal is larger than the main file keeps the amortized
+    cost of each journaled change constant, while the journal (and the
+    replay on every read) stays bounded by the size of the database.
+
+    This is best-effort: the changes are already safe in the journal, so a
+    failed rewrite only prints a warning and the journal is kept.
+    """
+    try:
+        journal_size = os.stat(journal_path(database_path)).st_size
+        database_size = os.stat(database_path).st_size
+    except OSError:
+        return
+    if journal_size > database_size and not write_mailing_list(data, database_path):
+        print(
+            f"Warning: the journal '{journal_path(database_path)}' could not be "
+            "folded into the database; it will be applied on every read until "
+            "the next successful rewrite."
+        )
+
+
 def write_mailing_list(data, database_path=None):
     """Write the mailing list to the JSON database file."""
     if database_path is None:
@@ -610,50 +1139,171 @@ def write_mailing_list(data, database_path=None):
 
     try:
         # Update last modified date
-        data["last_modified"] = datetime.now().strftime("%Y-%m-%d")
+        data["last_modified"] = _today()
 
         # Write JSON data
-        with open(database_path, "w") as f:
-            json.dump(data, f, indent=2)
+        write_json_file(database_path, data)
+        # `data` was read with the journal replayed, so it is now redundant
+        discard_journal(database_path)
         return True
     except Exception as e:
         print(f"Error writing to database: {str(e)}")
         return False
 
 
+class DatabaseSession:
+    """Read a database once, apply several operations, and write it once.
+
+    Usage:
+        with DatabaseSession() as session:
+            remove_email("a@example.com", session=session)
+            add_emails(["b@example.com"], session=session)
+
+    The functions that accept a `session` argument (`add_emails`,
+    `remove_email`, `optimize_command`) modify `session.data` and mark the
+    session dirty instead of reading the database and writing or journaling
+    each change. On exit the file is rewritten once, folding in any pending
+    journal, if something changed and no exception was raised; `saved`
+    tells whether that write succeeded.
+    """
+
+    def __init__(self, database_path=None):
+        if database_path is None:
+            database_path = get_active_database_path()
+        self.database_path = database_path
+        self.data = None
+        self.dirty = False
+        self.saved = True
+
+    def __enter__(self):
+        self.data = read_mailing_list(self.database_path)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self.dirty and self.data is not None:
+            self.saved = write_mailing_list(self.data, self.database_path)
+            self.dirty = not self.saved
+        return False
+
+
+class _OpenDatabase(DatabaseSession):
+    """DatabaseSession that hands out the data itself; see `open_db`."""
+
+    def __enter__(self):
+        super().__enter__()
+        # The caller edits the dict directly, so any change is assumed
+        self.dirty = self.data is not None
+        return self.data
+
+
+def open_db(database_path=None):
+    """Read a database once, yield its data dict, and write it back on exit.
+
+    Usage:
+        with open_db() as data:
+            optimize_batches(data)
+
+    For scripts that edit the data directly; the helpers that take a
+    `session` argument are used with a `DatabaseSession` instead. The file is
+    written (folding in any pending journal) unless the database could not be
+    read, in which case None is yielded, or an exception escaped the block.
+    """
+    return _OpenDatabase(database_path)
+
+
 def optimize_batches(data, max_per_batch=57):
     """
     Optimize the batches to minimize the number of batches while
     respecting the max_per_batch limit.
+
+    Duplicate addresses (compared case-insensitively) are dropped on the way,
+    keeping the first occurrence.
     """
-    # Flatten all email entries
-    all_emails = []
+    # Collect all email entries, keeping the first entry for each address;
+    # dicts preserve insertion order, so the original order is kept.
+    unique = {}
     for batch in data["batches"]:
-        all_emails.extend(batch["emails"])
+        for entry in batch["emails"]:
+            unique.setdefault(entry["email"].lower(), entry)
 
-    # Create new optimized batches
+    # Cut the entries into consecutive chunks of at most max_per_batch
+    # straight from the dict, without building a flat copy of the list first
+    entries = iter(unique.values())
     optimized_batches = []
-    current_batch = []
-
-    for email_entry in all_emails:
-        if len(current_batch) >= max_per_batch:
-            optimized_batches.append(
-                {"id": len(optimized_batches) + 1, "emails": current_batch}
-            )
-            current_batch = []
-        current_batch.append(email_entry)
-
-    # Add the last batch if it's not empty
-    if current_batch:
-        optimized_batches.append(
-            {"id": len(optimized_batches) + 1, "emails": current_batch}
-        )
+    while True:
+        chunk = list(islice(entries, max_per_batch))
+        if not chunk:
+            break
+        optimized_batches.append({"id": len(optimized_batches) + 1, "emails": chunk})
 
     # Update the data with optimized batches
     data["batches"] = optimized_batches
+    invalidate_email_index(data)
     return data
 
 
+def display_name(entry):
+    """Return the 'First Last' name shown for an entry, or its full name.
+
+    Falls back to the stored 'name' when neither first nor last name is set.
+    """
+    get = entry.get
+    name = f"{get('first_name', '')} {get('last_name', '')}".strip()
+    return name or get("name", "")
+
+
+def format_outlook_block(emails):
+    """Format batch entries as 'First Last <email>' lines for pasting into Outlook.
+
+    The lines are joined with ';' and a newline, so every line except the last
+    ends with a semicolon. Returns an empty string for an empty batch.
+    """
+    return ";\n".join(
+        [f"{display_name(entry)} <{entry['email']}>" for entry in emails]
+    )
+
+
+def format_detailed_lines(emails):
+    """Format batch entries as their stored full entry plus name components."""
+    lines = []
+    last_index = len(emails) - 1
+    append = lines.append
+    for j, entry in enumerate(emails):
+        # Bind the lookup once per entry; the fallback string is only built
+        # when an entry has no stored full entry.
+        get = entry.get
+        full_entry = get("full_entry")
+        if full_entry is None:
+            full_entry = f"{get('name', '')} <{entry['email']}>"
+        full_entry = full_entry.strip()
+        # Don't add semicolon to the last email in the batch. Only the trailing
+        # separator is dropped; a semicolon inside the entry is kept.
+        if j == last_index:
+            full_entry = full_entry.rstrip(";").rstrip()
+        append(f"  {full_entry}")
+
+        # Optionally show name components
+        first, middle, last = (
+            get("first_name", ""),
+            get("middle_names", ""),
+            get("last_name", ""),
+        )
+        if first or middle or last:
+            append(f"    First: {first}, Middle: {middle}, Last: {last}")
+    return lines
+
+
+def format_summary_lines(data):
+    """Return the header lines of the detailed listing (name, date, counts)."""
+    batches = data["batches"]
+    total_entries = sum([len(batch["emails"]) for batch in batches])
+    return [
+        f"Database: {data.get('name', 'Unknown')}",
+        f"Last modified: {data.get('last_modified', 'Unknown')}",
+        f"Found {total_entries} entries in {len(batches)} batches:",
+    ]
+
+
 def print_emails(data, batch_number=None, simple_format=False, output_file=None):
     """Print emails in batches.
 
@@ -665,106 +1315,58 @@ def print_emails(data, batch_number=None, simple_format=False, output_file=None)
     """
     # If we're writing to a file, we don't want any console output
     if output_file:
-        try:
-            with open(output_file, "w") as f:
-                # Process the requested batch
-                if batch_number == "all":
-                    # Write all batches to file
-                    for i, batch in enumerate(data["batches"], 1):
-                        if i == 1:
-                            f.write(f"=== Batch {i} ===\n\n")
-                        else:
-                            f.write(f"\n=== Batch {i} ===\n\n")
-                        for j, entry in enumerate(batch["emails"]):
-                            # Format for Outlook: First name Last name <email>;
-                            first = entry.get("first_name", "")
-                            last = entry.get("last_name", "")
-                            name = f"{first} {last}".strip()
-                            if not name:
-                                name = entry.get("name", "")
-
-                            # Don't add semicolon to the last email in the batch
-                            if j == len(batch["emails"]) - 1:
-                                f.write(f"{name} <{entry['email']}>")
-                            else:
-                                f.write(f"{name} <{entry['email']}>;")
-                            f.write("\n")
-
-                elif batch_number is not None:
-                    try:
-                        batch_num = int(batch_number)
-                        # Check if the batch exists
-                        if batch_num < 1 or batch_num > len(data["batches"]):
-                            print(f"Error: Batch {batch_num} does not exist.")
-                            print(f"Available batches: 1 to {len(data['batches'])}")
-                            return
-
-                        # Write the requested batch to file
-                        batch = data["batches"][batch_num - 1]
-                        f.write(f"=== Batch {batch_num} ===\n\n")
-                        for j, entry in enumerate(batch["emails"]):
-                            # Format for Outlook: First name Last name <email>;
-                            first = entry.get("first_name", "")
-                            last = entry.get("last_name", "")
-                            name = f"{first} {last}".strip()
-                            if not name:
-                                name = entry.get("name", "")
-
-                            # Don't add semicolon to the last email in the batch
-                            if j == len(batch["emails"]) - 1:
-                                f.write(f"{name} <{entry['email']}>")
-                            else:
-                                f.write(f"{name} <{entry['email']}>;")
-                            f.write("\n")
-
-                    except ValueError:
-                        print(f"Error: Invalid batch number '{batch_number}'.")
-                        return
-
-                else:
-                    # Write summary and all batches in detailed format
-                    total_entries = sum(
-                        len(batch["emails"]) for batch in data["batches"]
-                    )
-                    f.write(f"Database: {data.get('name', 'Unknown')}\n")
-                    f.write(f"Last modified: {data.get('last_modified', 'Unknown')}\n")
-                    f.write(
-                        f"Found {total_entries} entries in {len(data['batches'])} batches:\n"
-                    )
-
-                    for i, batch in enumerate(data["batches"], 1):
-                        if i == 1:
-                            f.write(f"\n=== Batch {i} ===\n\n")
-                        else:
-                            f.write(f"\n=== Batch {i} ===\n\n")
-                        for j, entry in enumerate(batch["emails"]):
-                            # Don't add semicolon to the last email in the batch
-                            full_entry = entry.get(
-                                "full_entry",
-                                f"{entry.get('name', '')} <{entry['email']}>",
-                            )
-                            if ";" in full_entry and j == len(batch["emails"]) - 1:
-                                full_entry = full_entry.replace(";", "")
-
-                            f.write(f"  {full_entry.strip()}\n")
-
-                            # Optionally show name components
-                            first = entry.get("first_name", "")
-                            middle = entry.get("middle_names", "")
-                            last = entry.get("last_name", "")
-                            if first or middle or last:
-                                f.write(
-                                    f"    First: {first}, Middle: {middle}, Last: {last}\n"
-                                )
-
-            # Only print success message after closing the file
-            print(f"Successfully wrote to '{output_file}'.")
-            return
+        # The whole output is assembled first and written with one call,
+        # so the file is only created once there is something to write
+        parts = []
+        if batch_number == "all":
+            # Write all batches to file
+            for i, batch in enumerate(data["batches"], 1):
+                parts.append(
+                    f"=== Batch {i} ===\n\n" if i == 1 else f"\n=== Batch {i} ===\n\n"
+                )
+                if batch["emails"]:
+                    parts.append(format_outlook_block(batch["emails"]) + "\n")
+
+        elif batch_number is not None:
+            try:
+                batch_num = int(batch_number)
+            except ValueError:
+                print(f"Error: Invalid batch number '{batch_number}'.")
+                return
+
+            # Check if the batch exists
+            if batch_num < 1 or batch_num > len(data["batches"]):
+                print(f"Error: Batch {batch_num} does not exist.")
+                print(f"Available batches: 1 to {len(data['batches'])}")
+                return
+
+            # Write the requested batch to file
+            batch = data["batches"][batch_num - 1]
+            parts.append(f"=== Batch {batch_num} ===\n\n")
+            if batch["emails"]:
+                parts.append(format_outlook_block(batch["emails"]) + "\n")
 
+        else:
+            # Write summary and all batches in detailed format
+            parts.extend(f"{line}\n" for line in format_summary_lines(data))
+
+            for i, batch in enumerate(data["batches"], 1):
+                parts.append(f"\n=== Batch {i} ===\n\n")
+                parts.extend(
+                    f"{line}\n" for line in format_detailed_lines(batch["emails"])
+                )
+
+        try:
+            with open(output_file, "wb") as f:
+                f.write("".join(parts).encode("utf-8"))
         except Exception as e:
             print(f"Error opening file '{output_file}' for writing: {str(e)}")
             return
 
+        # Only print success message after closing the file
+        print(f"Successfully wrote to '{output_file}'.")
+        return
+
     # Console output (only when no output_file is specified)
     if not data:
         print("No data found in the database.")
@@ -778,21 +1380,12 @@ def print_emails(data, batch_number=None, simple_format=False, output_file=None)
     if batch_number is not None:
         if batch_number == "all":
             # Print all batches in simple format
+            out = []
             for i, batch in enumerate(data["batches"], 1):
-                print(f"\n=== Batch {i} ===\n")
-                for j, entry in enumerate(batch["emails"]):
-                    # Format for Outlook: First name Last name <email>;
-                    first = entry.get("first_name", "")
-                    last = entry.get("last_name", "")
-                    name = f"{first} {last}".strip()
-                    if not name:
-                        name = entry.get("name", "")
-
-                    # Don't add semicolon to the last email in the batch
-                    if j == len(batch["emails"]) - 1:
-                        print(f"{name} <{entry['email']}>")
-                    else:
-                        print(f"{name} <{entry['email']}>;")
+                out.append(f"\n=== Batch {i} ===\n")
+                if batch["emails"]:
+                    out.append(format_outlook_block(batch["emails"]))
+            print_lines(out)
             return
 
         try:
@@ -805,38 +1398,13 @@ def print_emails(data, batch_number=None, simple_format=False, output_file=None)
 
             # Print the requested batch
             batch = data["batches"][batch_num - 1]
-            print(f"\n=== Batch {batch_num} ===\n")
+            out = [f"\n=== Batch {batch_num} ===\n"]
             if simple_format:
-                for j, entry in enumerate(batch["emails"]):
-                    # Format for Outlook: First name Last name <email>;
-                    first = entry.get("first_name", "")
-                    last = entry.get("last_name", "")
-                    name = f"{first} {last}".strip()
-                    if not name:
-                        name = entry.get("name", "")
-
-                    # Don't add semicolon to the last email in the batch
-                    if j == len(batch["emails"]) - 1:
-                        print(f"{name} <{entry['email']}>")
-                    else:
-                        print(f"{name} <{entry['email']}>;")
+                if batch["emails"]:
+                    out.append(format_outlook_block(batch["emails"]))
             else:
-                for j, entry in enumerate(batch["emails"]):
-                    # Don't add semicolon to the last email in the batch
-                    full_entry = entry.get(
-                        "full_entry", f"{entry.get('name', '')} <{entry['email']}>"
-                    )
-                    if ";" in full_entry and j == len(batch["emails"]) - 1:
-                        full_entry = full_entry.replace(";", "")
-
-                    print(f"  {full_entry.strip()}")
-
-                    # Optionally show name components
-                    first = entry.get("first_name", "")
-                    middle = entry.get("middle_names", "")
-                    last = entry.get("last_name", "")
-                    if first or middle or last:
-                        print(f"    First: {first}, Middle: {middle}, Last: {last}")
+                out.extend(format_detailed_lines(batch["emails"]))
+            print_lines(out)
             return
 
         except ValueError:
@@ -844,32 +1412,17 @@ def print_emails(data, batch_number=None, simple_format=False, output_file=None)
             return
 
     # Print summary and all batches in detailed format
-    total_entries = sum(len(batch["emails"]) for batch in data["batches"])
-    print(f"Database: {data.get('name', 'Unknown')}")
-    print(f"Last modified: {data.get('last_modified', 'Unknown')}")
-    print(f"Found {total_entries} entries in {len(data['batches'])} batches:")
-
+    out = format_summary_lines(data)
     for i, batch in enumerate(data["batches"], 1):
-        if i == 1:
-            print(f"\n=== Batch {i} ===\n")
-        else:
-            print(f"\n=== Batch {i} ===\n")
-        for j, entry in enumerate(batch["emails"]):
-            # Don't add semicolon to the last email in the batch
-            full_entry = entry.get(
-                "full_entry", f"{entry.get('name', '')} <{entry['email']}>"
-            )
-            if ";" in full_entry and j == len(batch["emails"]) - 1:
-                full_entry = full_entry.replace(";", "")
+        out.append(f"\n=== Batch {i} ===\n")
+        out.extend(format_detailed_lines(batch["emails"]))
+    print_lines(out)
 
-            print(f"  {full_entry.strip()}")
 
-            # Optionally show name components
-            first = entry.get("first_name", "")
-            middle = entry.get("middle_names", "")
-            last = entry.get("last_name", "")
-            if first or middle or last:
-                print(f"    First: {first}, Middle: {middle}, Last: {last}")
+def print_lines(lines):
+    """Print a list of lines to stdout with a single write."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def is_email_exists(email, data):
@@ -877,54 +1430,85 @@ def is_email_exists(email, data):
     if not data or not data.get("batches"):
         return False
 
-    for batch in data["batches"]:
-        for entry in batch["emails"]:
-            if entry["email"].lower() == email.lower():
-                return True
+    return email.lower() in get_email_index(data)
 
-    return False
 
+def place_entry(data, entry):
+    """Append an entry to the last batch if it has room, else to a new batch.
+
+    A cached email index is updated with the new entry's position.
+    """
+    batches = data["batches"]
+    if batches and len(batches[-1]["emails"]) < MAX_EMAILS_PER_BATCH:
+        batches[-1]["emails"].append(entry)
+    else:
+        batches.append({"id": len(batches) + 1, "emails": [entry]})
+
+    index = data.get("_email_index")
+    email = entry.get("email")
+    if index is not None and email:
+        location = (len(batches) - 1, len(batches[-1]["emails"]) - 1)
+        if index.setdefault(email.lower(), location) != location:
+            data["_email_duplicates"] = True
 
-def add_email_entry(entry, data):
-    """Add a new email entry to the database if it doesn't exist."""
-    if is_email_exists(entry["email"], data):
-        print(f"Email '{entry['email']}' already exists in the database.")
-        return False
 
-    # Format the new entry
+def place_entries(data, entries):
+    """Append new, distinct `entries` in order, as `place_entry` would one by one.
+
+    The free space of the last batch is filled and new batches are opened
+    with list slices, one batch at a time. Appending never moves existing
+    entries, so a cached email index is updated rather than dropped.
+    """
+    batches = data["batches"]
+    index = data.get("_email_index")
+    start = 0
+    if batches:
+        emails = batches[-1]["emails"]
+        start = max(0, MAX_EMAILS_PER_BATCH - len(emails))
+        if start:
+            if index is not None:
+                for entry_idx, entry in enumerate(entries[:start], len(emails)):
+                    index[entry["email"].lower()] = (len(batches) - 1, entry_idx)
+            emails.extend(entries[:start])
+    for chunk_start in range(start, len(entries), MAX_EMAILS_PER_BATCH):
+        chunk = entries[chunk_start : chunk_start + MAX_EMAILS_PER_BATCH]
+        if index is not None:
+            for entry_idx, entry in enumerate(chunk):
+                index[entry["email"].lower()] = (len(batches), entry_idx)
+        batches.append({"id": len(batches) + 1, "emails": chunk})
+
+
+def format_new_entry(entry):
+    """Complete a parsed entry with its standard `full_entry` and name fields.
+
+    `entry` (as returned by `parse_email_entries`) is updated in place rather
+    than copied, so it must not be reused by the caller.
+    """
     name = entry.get("name", "")
     email = entry["email"]
 
     if name:
-        full_entry = f'"{name}" <{email}>;'
+        entry["full_entry"] = f'"{name}" <{email}>;'
     else:
-        full_entry = f"<{email}>;"
-
-    new_entry = {
-        "email": email,
-        "name": name,
-        "full_entry": full_entry,
-        "first_name": entry.get("first_name", ""),
-        "middle_names": entry.get("middle_names", ""),
-        "last_name": entry.get("last_name", ""),
-    }
+        entry["full_entry"] = f"<{email}>;"
+    for key in ("name", "first_name", "middle_names", "last_name"):
+        entry.setdefault(key, "")
+    return entry
 
-    # Add to the last batch if it exists and has room, otherwise create a new batch
-    if data["batches"] and len(data["batches"][-1]["emails"]) < MAX_EMAILS_PER_BATCH:
-        data["batches"][-1]["emails"].append(new_entry)
-    else:
-        data["batches"].append({"id": len(data["batches"]) + 1, "emails": [new_entry]})
-
-    print(f"Successfully added '{email}' to the database.")
-    return True
 
+def add_emails(entries_str, database_path=None, session=None):
+    """Add one or more emails to the database.
 
-def add_emails(entries_str, database_path=None):
-    """Add one or more emails to the database."""
-    if database_path is None:
-        database_path = get_active_database_path()
-
-    data = read_mailing_list(database_path)
+    Without a session, the new entries are appended to the database's journal
+    rather than rewriting the whole file. With a `session`, they are added to
+    the session's data and saved when it closes.
+    """
+    if session is not None:
+        data = session.data
+    else:
+        if database_path is None:
+            database_path = get_active_database_path()
+        data = read_mailing_list(database_path)
     if not data:
         return False
 
@@ -933,70 +1517,255 @@ def add_emails(entries_str, database_path=None):
         print("No valid email entries found.")
         return False
 
-    added_count = 0
+    # Drop addresses repeated within the input (case-insensitively, keeping
+    # the first) before they reach the database checks
+    unique = {}
     for entry in parsed_entries:
-        if add_email_entry(entry, data):
-            added_count += 1
+        unique.setdefault(entry["email"].lower(), entry)
+    if len(unique) < len(parsed_entries):
+        print(
+            f"Ignoring {len(parsed_entries) - len(unique)} repeated entr(ies) in the input."
+        )
+        parsed_entries = list(unique.values())
 
-    if added_count > 0:
-        if write_mailing_list(data, database_path):
-            print(f"Successfully added {added_count} email(s) to the database.")
-            return True
+    # Check every entry first (the input holds no repeats, so only the
+    # database can), then place the new ones in one go
+    added = []
+    for entry in parsed_entries:
+        if is_email_exists(entry["email"], data):
+            print(f"Email '{entry['email']}' already exists in the database.")
+            continue
+        added.append(format_new_entry(entry))
+    if not added:
+        return False
+    place_entries(data, added)
+
+    if session is not None:
+        session.dirty = True
+    elif not append_to_journal(
+        [{"op": "add", "date": _today(), "entry": entry} for entry in added],
+        database_path,
+    ):
+        return False
 
-    return False
+    # Report the additions only once they are recorded
+    print_lines(
+        [f"Successfully added '{entry['email']}' to the database." for entry in added]
+    )
+    print(f"Successfully added {len(added)} email(s) to the database.")
+    if session is None:
+        compact_journal_if_large(data, database_path)
+    return True
 
 
-def optimize_command(database_path=None):
+def optimize_command(database_path=None, session=None):
     """Reorganize emails to use the minimum number of batches.
 
     This command reorganizes all emails to use the minimum number of batches
     possible while respecting the maximum of 57 emails per batch.
 
     When adding emails one at a time, you might end up with partially filled
-    batches. This command consolidates all emails to maximize batch usage.
-    """
-    if database_path is None:
-        database_path = get_active_database_path()
+    batches. This command consolidates all emails to maximize batch usage and
+    drops duplicate addresses.
 
-    data = read_mailing_list(database_path)
+    With a `session`, the session's data is optimized and saved when it closes.
+    """
+    if session is not None:
+        data = session.data
+        database_path = session.database_path
+    else:
+        if database_path is None:
+            database_path = get_active_database_path()
+        data = read_mailing_list(database_path)
     if not data:
         return False
 
-    original_batch_count = len(data["batches"])
-    optimized_data = optimize_batches(data)
+    original_batch_count, batch_count, duplicate_count, changed = _optimize_in_place(
+        data
+    )
+
+    if not _needs_rewrite(changed, database_path):
+        print(f"The database is already optimal ({batch_count} batches).")
+        return True
+
+    if session is not None:
+        session.dirty = True
+        saved = True
+    else:
+        saved = write_mailing_list(data, database_path)
 
-    if write_mailing_list(optimized_data, database_path):
+    if saved:
         print(
-            f"Successfully optimized the database from {original_batch_count} to {len(optimized_data['batches'])} batches."
+            f"Successfully optimized the database from {original_batch_count} to {batch_count} batches."
         )
+        if duplicate_count:
+            print(f"Removed {duplicate_count} duplicate email(s).")
         return True
     else:
         return False
 
 
+def _optimize_in_place(data):
+    """Optimize `data` and return its counts and whether it changed.
+
+    The result is (batches before, batches after, duplicates removed,
+    changed). `changed` is False when the optimized batches are exactly the
+    original ones: optimizing keeps the order of the entries, so with no
+    duplicates removed and the same batch IDs and sizes the contents are
+    unchanged.
+    """
+    original_layout = [
+        (batch.get("id"), len(batch["emails"])) for batch in data["batches"]
+    ]
+    optimize_batches(data)
+    layout = [(batch["id"], len(batch["emails"])) for batch in data["batches"]]
+    duplicate_count = sum(size for _, size in original_layout) - sum(
+        size for _, size in layout
+    )
+    changed = duplicate_count != 0 or layout != original_layout
+    return len(original_layout), len(layout), duplicate_count, changed
+
+
+def _needs_rewrite(changed, database_path):
+    """Return True if an optimized database must be written back.
+
+    An unchanged database is still rewritten when it has a pending journal,
+    so that `optimize` always leaves a self-contained JSON file.
+    """
+    return changed or os.path.exists(journal_path(database_path))
+
+
+def _optimize_file(database_path):
+    """Optimize and rewrite one database file for `optimize_all_databases`.
+
+    Returns (batches before, batches after, duplicates removed, rewritten),
+    where `rewritten` tells whether the file was written (see
+    `_needs_rewrite`), or None if the database could not be read or written.
+    """
+    data = read_mailing_list(database_path)
+    if not data:
+        return None
+    original_batch_count, batch_count, duplicate_count, changed = _optimize_in_place(
+        data
+    )
+    rewritten = _needs_rewrite(changed, database_path)
+    if rewritten and not write_mailing_list(data, database_path):
+        return None
+    return original_batch_count, batch_count, duplicate_count, rewritten
+
+
+def optimize_all_databases():
+    """Optimize every database in DATABASE_FOLDER (the `optimize all` command).
+
+    The databases are independent files, so they are processed by a thread
+    pool: reading and writing one file overlaps with work on the others. The
+    results are reported together, in name order, once all are done.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    names = sorted(list_databases())
+    if not names:
+        print(f"No databases found in '{DATABASE_FOLDER}'.")
+        return False
+
+    paths = [os.path.join(DATABASE_FOLDER, name) for name in names]
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+        results = list(executor.map(_optimize_file, paths))
+
+    lines = []
+    for name, counts in zip(names, results):
+        if counts is None:
+            lines.append(f"  {name}: failed")
+            continue
+        original_batch_count, batch_count, duplicate_count, rewritten = counts
+        if not rewritten:
+            lines.append(f"  {name}: already optimal ({batch_count} batches)")
+            continue
+        line = f"  {name}: {original_batch_count} -> {batch_count} batches"
+        if duplicate_count:
+            line += f", removed {duplicate_count} duplicate email(s)"
+        lines.append(line)
+    print(f"Optimized {len(names)} database(s):")
+    print_lines(lines)
+    return all(counts is not None for counts in results)
+
+
+def set_storage_format(compact, database_path=None):
+    """Rewrite the database as compact (`compact`) or indented (`prettify`) JSON.
+
+    Compact files are smaller and faster to write; indented files are easier
+    to read and diff. The chosen layout is kept by every later write. The
+    contents, including `last_modified`, are left unchanged.
+    """
+    if database_path is None:
+        database_path = get_active_database_path()
+
+    data = read_mailing_list(database_path)
+    if not data:
+        return False
+
+    if compact:
+        data["_compact"] = True
+    else:
+        data.pop("_compact", None)
+
+    try:
+        write_json_file(database_path, data)
+        discard_journal(database_path)
+    except Exception as e:
+        print(f"Error writing to database: {str(e)}")
+        return False
+
+    layout = "compact" if compact else "indented"
+    print(
+        f"Database '{os.path.basename(database_path)}' is now stored as {layout} JSON."
+    )
+    return True
+
+
 def load_database(db_path):
     """Load the database from the specified JSON file."""
-    if not os.path.exists(db_path):
+    try:
+        return replay_journal(read_json_file(db_path), db_path)
+    except FileNotFoundError:
         print(f"Error: Database file '{db_path}' not found.")
         return None
-    try:
-        with open(db_path, "r") as f:
-            return json.load(f)
     except Exception as e:
         print(f"Error loading database: {str(e)}")
         return None
 
 
-def get_all_emails(db_path):
-    """Get all emails from the database."""
-    data = load_database(db_path)
+def get_all_emails(db):
+    """Get all emails from the database.
+
+    `db` is either the path of a database file or an already loaded database,
+    which is used as is instead of being parsed again.
+    """
+    data = db if isinstance(db, dict) else load_database(db)
     if not data:
         return []
 
-    all_emails = []
-    for batch in data["batches"]:
-        all_emails.extend(batch["emails"])
-    return all_emails
+    return list(iter_all_emails(data))
+
+
+def iter_all_emails(data):
+    """Yield every email entry of already loaded database `data`, batch by batch."""
+    return (entry for batch in data["batches"] for entry in batch["emails"])
+
+
+@lru_cache(maxsize=64)
+def compile_check_pattern(pattern):
+    """Return a case-insensitive `match(text)` predicate for a `check` pattern.
+
+    A plain ASCII word without regex metacharacters (the usual 'name' or
+    'domain' lookup) is matched with a substring test on the lowercased text,
+    which skips the regex engine and is several times faster. Anything else
+    is compiled as a regular expression. Raises re.error for invalid patterns.
+    """
+    if pattern.isascii() and re.escape(pattern) == pattern:
+        needle = pattern.lower()
+        return lambda text: needle in text.lower()
+    return re.compile(pattern, re.IGNORECASE).search
 
 
 def check_emails(pattern):
@@ -1006,7 +1775,8 @@ def check_emails(pattern):
     if db_data is None:
         return
 
-    all_emails = get_all_emails(db_path)  # Reuse existing function to get flat list
+    # Walk the data loaded above instead of reading the file a second time
+    all_emails = iter_all_emails(db_data)
     found_matches = False
 
     print(
@@ -1014,18 +1784,29 @@ def check_emails(pattern):
     )
 
     try:
-        regex = re.compile(pattern, re.IGNORECASE)  # Case-insensitive search
+        search = compile_check_pattern(pattern)  # Case-insensitive search
     except re.error as e:
         print(f"Error: Invalid regular expression: {e}")
         return
 
-    for entry in all_emails:
-        # Check against the email address and the full entry string
-        if regex.search(entry.get("email", "")) or regex.search(
-            entry.get("full_entry", "")
-        ):
-            print(f"  Match found: {entry.get('full_entry', entry.get('email'))}")
-            found_matches = True
+    # Check against the email address and the full entry string. The pattern
+    # is compiled once above; the per-field search is kept on purpose: joining
+    # all fields into one buffer for a single finditer scan was measured to be
+    # no faster, as case-insensitive scanning dominates and building the buffer
+    # costs as much as the searches it replaces.
+    matches = [
+        entry
+        for entry in all_emails
+        if search(entry.get("email", "")) or search(entry.get("full_entry", ""))
+    ]
+    if matches:
+        print_lines(
+            [
+                f"  Match found: {entry.get('full_entry', entry.get('email'))}"
+                for entry in matches
+            ]
+        )
+        found_matches = True
 
     if not found_matches:
         print("  No matches found.")
@@ -1061,16 +1842,9 @@ def create_new_database(db_name):
     # Construct the full path within the designated DATABASE_FOLDER.
     db_path = os.path.join(DATABASE_FOLDER, db_filename)
 
-    # --- Prevent Overwriting --- Check if a file with this name already exists.
-    if os.path.exists(db_path):
-        print(
-            f"Error: Database '{db_filename}' already exists in '{DATABASE_FOLDER}'. Use a different name or delete the existing file first."
-        )
-        return False
-
     # --- Initial Database Structure ---
     # Define the content for the new JSON database file.
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # More precise timestamp
+    now_str = _timestamp()  # More precise timestamp
     new_db_content = {
         "name": safe_db_name,  # Use the cleaned base name.
         "created": now_str,
@@ -1079,23 +1853,59 @@ def create_new_database(db_name):
     }
 
     # --- Write to File ---
+    # The complete file is written under a temporary name and then hard-linked
+    # to its final name. The link fails if the name is already taken, so an
+    # existing database is never overwritten, and no other command can see
+    # the new file before its content is complete.
     try:
-        # Ensure the DATABASE_FOLDER directory exists before writing the file.
-        os.makedirs(DATABASE_FOLDER, exist_ok=True)
-        # Write the initial structure to the new file using UTF-8 encoding.
-        with open(db_path, "w", encoding="utf-8") as f:
-            json.dump(new_db_content, f, indent=2)  # Use indent for readability.
-        print(f"Database '{db_filename}' created successfully in '{DATABASE_FOLDER}'.")
-        return True
-    except IOError as e:
-        # Handle potential file system errors during writing.
+        created = _create_file_exclusively(db_path, json_dumps(new_db_content))
+    except OSError as e:
         print(f"Error creating database file '{db_path}': {e}")
         return False
-    except Exception as e:
-        # Catch any other unexpected errors.
-        print(f"An unexpected error occurred during database creation: {e}")
+    if not created:
+        print(
+            f"Error: Database '{db_filename}' already exists in '{DATABASE_FOLDER}'. Use a different name or delete the existing file first."
+        )
         return False
 
+    discard_journal(db_path)  # Drop any journal left by an older database.
+    print(f"Database '{db_filename}' created successfully in '{DATABASE_FOLDER}'.")
+    return True
+
+
+def _create_file_exclusively(path, content):
+    """Create `path` with the bytes `content` unless it already exists.
+
+    Returns False if `path` exists. The content is written to a temporary
+    file in the same folder and published with os.link, which fails instead
+    of replacing an existing file. On file systems without hard links the
+    file is created with an exclusive open and written directly.
+    """
+    import tempfile
+
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            sync_file(f)
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            return False
+        except OSError:
+            # No hard links here (e.g. FAT file systems)
+            try:
+                with open(path, "xb") as f:
+                    f.write(content)
+                    sync_file(f)
+            except FileExistsError:
+                return False
+        return True
+    finally:
+        os.remove(tmp_path)
+
 
 def delete_database(db_name):
     """Delete an existing database file after explicit user confirmation.
@@ -1152,6 +1962,7 @@ def delete_database(db_name):
     # --- Proceed with Deletion ---
     try:
         os.remove(db_path)
+        discard_journal(db_path)
         print(f"Database '{db_filename}' deleted successfully.")
 
         # --- Update Config if Active DB was Deleted ---
@@ -1302,35 +2113,43 @@ def add_emails_to_database(emails_to_add):
             return False
 
     # --- Prepare for Duplicate Checking ---
-    # Create a set of existing email addresses (lowercase for case-insensitivity)
-    # for efficient duplicate checking.
-    existing_emails_lower = set()
-    for batch in db_data.get("batches", []):
-        for email_entry in batch.get("emails", []):
-            email = email_entry.get("email")
-            if email:
-                existing_emails_lower.add(email.lower())
+    # The email index (lowercase keys, for case-insensitivity) answers duplicate
+    # checks against the database; `by_lower` covers the input list.
+    email_index = get_email_index(db_data)
 
     # --- Filter New Emails --- Separate actual new entries from duplicates/invalid.
-    newly_added_entries = []  # List to hold only the entries that will be added.
-    added_count = 0
-    skipped_count = 0
+    # First pass: key the input by lowercased address, keeping the first
+    # occurrence, so duplicates *within* the input list are dropped.
+    by_lower = {}
+    duplicates = []
+    missing_count = 0
     for new_entry in emails_to_add:
         email_addr = new_entry.get("email")
-        # Check if the email exists and if its lowercase version is not in the set.
-        if email_addr and email_addr.lower() not in existing_emails_lower:
-            newly_added_entries.append(new_entry)
-            # Add to the set immediately to handle duplicates *within* the input list itself.
-            existing_emails_lower.add(email_addr.lower())
-            added_count += 1
-        elif email_addr:  # Email exists but is a duplicate.
-            print(f"Skipping duplicate: {email_addr}")
-            skipped_count += 1
-        else:  # Entry lacks an email address (shouldn't happen with proper parsing).
+        if not email_addr:  # Shouldn't happen with proper parsing.
             print(
                 f"Warning: Skipping entry with missing email address: {new_entry.get('full_entry', 'Invalid Entry')}"
             )
-            skipped_count += 1
+            missing_count += 1
+        elif email_addr.lower() in by_lower:
+            duplicates.append(email_addr)
+        else:
+            by_lower[email_addr.lower()] = new_entry
+
+    # Then find the addresses already in the database with one set operation.
+    known = by_lower.keys() & email_index.keys()
+    duplicates.extend(by_lower[email_lower]["email"] for email_lower in known)
+    # Maps the lowercased address to the entry, for the entries that will be added.
+    newly_added_entries = (
+        {lower: entry for lower, entry in by_lower.items() if lower not in known}
+        if known
+        else by_lower
+    )
+    if duplicates:
+        print(
+            f"Skipping {len(duplicates)} duplicate(s): {', '.join(sorted(duplicates))}"
+        )
+    added_count = len(newly_added_entries)
+    skipped_count = len(duplicates) + missing_count
 
     # If, after filtering, there are no new emails to add, report and exit.
     if not newly_added_entries:
@@ -1348,21 +2167,23 @@ def add_emails_to_database(emails_to_add):
     # Ensure 'batches' list exists in the database dictionary.
     batches = db_data.setdefault("batches", [])
 
-    for email_to_add in newly_added_entries:
-        added_to_existing_batch = False
-        # Iterate through existing batches to find one with space.
-        for batch in batches:
+    # Batches only fill up while adding, so the first batch with space never
+    # moves backwards: a cursor finds it without rescanning the full batches.
+    batch_idx = 0
+    for email_lower, email_to_add in newly_added_entries.items():
+        # Advance to the first batch with space, if any.
+        while batch_idx < len(batches):
             # Ensure the 'emails' list exists within the batch dictionary.
-            batch_emails = batch.setdefault("emails", [])
+            batch_emails = batches[batch_idx].setdefault("emails", [])
             # Check if the current batch is below the maximum size limit.
             if len(batch_emails) < MAX_EMAILS_PER_BATCH:
-                batch_emails.append(email_to_add)
-                added_to_existing_batch = True
-                break  # Email added, move to the next email_to_add.
+                break
+            batch_idx += 1
 
-        # If the email wasn't added to any existing batch (all were full),
-        # create a new batch for it.
-        if not added_to_existing_batch:
+        if batch_idx < len(batches):
+            batch_emails.append(email_to_add)
+        else:
+            # All existing batches are full: create a new batch for it.
             # Determine the ID for the new batch. Find the max existing ID and add 1.
             # Handle the case of no existing batches ([0] ensures max works).
             new_batch_id = max([b.get("id", 0) for b in batches] + [0]) + 1
@@ -1371,16 +2192,18 @@ def add_emails_to_database(emails_to_add):
                 "emails": [email_to_add],  # Start the new batch with this email.
             }
             batches.append(new_batch)
+            batch_emails = new_batch["emails"]
             print(
                 f"Created new batch (ID: {new_batch_id}) for {email_to_add.get('email')}."
             )
+        email_index[email_lower] = (batch_idx, len(batch_emails) - 1)
 
     # --- Finalize and Save --- Update timestamp and write back to the file.
-    db_data["last_modified"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    db_data["last_modified"] = _timestamp()
 
     try:
-        with open(db_path, "w", encoding="utf-8") as f:
-            json.dump(db_data, f, indent=2)
+        write_json_file(db_path, db_data)
+        discard_journal(db_path)  # Its records were replayed into db_data.
         print(
             f"Successfully added {added_count} new email(s) to '{os.path.basename(db_path)}'."
         )
@@ -1430,11 +2253,17 @@ def remove_email_from_database(email_to_remove):
     found_and_removed = False
     email_to_remove_lower = email_to_remove.lower()  # For case-insensitive comparison.
     batches = db_data.get("batches", [])
-    # Keep track of batches that become empty after removal.
-    indices_of_empty_batches = []
 
-    # Iterate through each batch using index for potential removal.
-    for i, batch in enumerate(batches):
+    # The index holds the first occurrence, so batches before it cannot
+    # contain the address and an unknown address needs no scan at all.
+    location = get_email_index(db_data).get(email_to_remove_lower)
+    first_batch = location[0] if location is not None else len(batches)
+
+    # Batches are filtered in the same pass: the ones that become empty are
+    # left out of `kept_batches`, which replaces the batch list at the end.
+    kept_batches = batches[:first_batch]
+    emptied_count = 0
+    for batch in batches[first_batch:]:
         emails_in_batch = batch.get("emails", [])
         initial_count = len(emails_in_batch)
 
@@ -1450,39 +2279,32 @@ def remove_email_from_database(email_to_remove):
             batch["emails"] = updated_emails  # Update the batch with the filtered list.
             found_and_removed = True
             print(f"Removed '{email_to_remove}' from batch {batch.get('id', 'N/A')}.")
-            # If the batch is now empty, mark its index for removal later.
+            # If the batch is now empty, drop it.
             if not updated_emails:
-                indices_of_empty_batches.append(i)
-            # Optimization: If we only expect one instance, we could break here.
-            # Assuming duplicates are possible or we want to remove all instances,
-            # we continue searching other batches.
+                emptied_count += 1
+                continue
+            # Duplicates are possible and all instances are removed, so the
+            # search continues through the remaining batches.
+        kept_batches.append(batch)
 
     # --- Handle Email Not Found ---
     if not found_and_removed:
         print(f"Email '{email_to_remove}' not found in the database.")
         return False  # Return False as no change was made.
+    invalidate_email_index(db_data)  # Entries have moved.
 
     # --- Remove Empty Batches ---
-    # Remove empty batches by rebuilding the list, excluding the marked indices.
-    # Iterating backwards by index or rebuilding is safer than removing while iterating.
-    if indices_of_empty_batches:
-        print(f"Removing {len(indices_of_empty_batches)} batch(es) that became empty.")
-        # Create a new list containing only non-empty batches.
-        updated_batches = [
-            batch
-            for idx, batch in enumerate(batches)
-            if idx not in indices_of_empty_batches
-        ]
-        db_data["batches"] = updated_batches
-        # Optional: Re-assign batch IDs sequentially after removing empty ones?
-        # For simplicity, we currently keep original IDs.
+    if emptied_count:
+        print(f"Removing {emptied_count} batch(es) that became empty.")
+        db_data["batches"] = kept_batches
+        # Batch IDs are kept as they are rather than renumbered.
 
     # --- Finalize and Save ---
-    db_data["last_modified"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    db_data["last_modified"] = _timestamp()
 
     try:
-        with open(db_path, "w", encoding="utf-8") as f:
-            json.dump(db_data, f, indent=2)
+        write_json_file(db_path, db_data)
+        discard_journal(db_path)  # Its records were replayed into db_data.
         print(f"Database '{os.path.basename(db_path)}' updated successfully.")
         return True
     except IOError as e:
@@ -1495,129 +2317,203 @@ def remove_email_from_database(email_to_remove):
         return False
 
 
-def main():
-    """Main entry point of the script."""
-    args = parse_arguments()
-    command = args.command.lower()
+def _invalid_command():
+    """Report an unknown command or a command missing its arguments.
 
-    if command == "print":
-        if not args.args:
-            print("Error: The 'print' command requires either 'all' or a batch number.")
-            print("Use 'python3 semlist.py print all' to print all emails.")
-            print(
-                "Use 'python3 semlist.py print [BATCH_NUMBER]' to print a specific batch."
-            )
-            return
+    See `_usage_error`.
+    """
+    _usage_error(
+        "Invalid command or missing arguments.",
+        "Use 'python3 semlist.py help' for usage information.",
+    )
 
-        # Check if we have an output file specified
-        batch_number = args.args[0]
-        output_file = None
-        if len(args.args) > 1:
-            output_file = args.args[1]
 
-        data = read_mailing_list()
-        if data:
-            print_emails(
-                data, batch_number, simple_format=True, output_file=output_file
-            )
+def _usage_error(*lines):
+    """Write `lines` to stderr and exit with status 2.
+
+    Status 2 is the usual status for command-line usage errors, so scripts
+    can detect the failure; every command reports missing arguments this way.
+    """
+    sys.stderr.write("\n".join(lines) + "\n")
+    sys.exit(2)
+
+
+def _print_available_databases():
+    """List the databases in DATABASE_FOLDER, if any, with a hint to activate one.
+
+    Returns True if at least one database was listed.
+    """
+    existing_dbs = list_databases()
+    if not existing_dbs:
+        return False
+    lines = ["\nAvailable databases:"]
+    lines.extend(f"  {db}" for db in existing_dbs)
+    lines.append(
+        "\nUse 'python3 semlist.py activate <database_name>' to activate one of these."
+    )
+    print_lines(lines)
+    return True
+
+
+def _cmd_print(args):
+    """`print` command: Print all emails or one batch, to the screen or to a file."""
+    if not args.args:
+        _usage_error(
+            "Error: The 'print' command requires either 'all' or a batch number.",
+            "Use 'python3 semlist.py print all' to print all emails.",
+            "Use 'python3 semlist.py print [BATCH_NUMBER]' to print a specific batch.",
+        )
+
+    # Check if we have an output file specified
+    batch_number = args.args[0]
+    output_file = None
+    if len(args.args) > 1:
+        output_file = args.args[1]
+
+    data = _cached_read()
+    if data:
+        print_emails(data, batch_number, simple_format=True, output_file=output_file)
+
+
+def _cmd_batches(args):
+    """`batches` command: Print the number of batches and emails in each."""
+    data = _cached_read()
+    if data and data.get("batches"):
+        lines = [f"Number of batches: {len(data['batches'])}"]
+        lines.extend(
+            f"  Batch {i}: {len(batch['emails'])} emails"
+            for i, batch in enumerate(data["batches"], 1)
+        )
+        print_lines(lines)
+    else:
+        print("No batches found in the database.")
 
-    elif command == "batches":
-        data = read_mailing_list()
-        if data and data.get("batches"):
-            print(f"Number of batches: {len(data['batches'])}")
-            for i, batch in enumerate(data["batches"], 1):
-                print(f"  Batch {i}: {len(batch['emails'])} emails")
-        else:
-            print("No batches found in the database.")
-
-    elif command == "stat":
-        show_statistics()
-
-    elif command == "check":
-        if not args.args:
-            print("Error: 'check' command requires a regex pattern.")
-            display_help()
-            sys.exit(1)
-        pattern = " ".join(args.args)  # Join args in case pattern has spaces
-        check_emails(pattern)
-
-    elif command == "add" and len(args.args) > 0:
-        # Check if the default database exists, if not, inform user to create one
-        active_db = get_active_database_path()
-        if not os.path.exists(active_db):
-            print(f"Error: Active database file '{active_db}' does not exist.")
-
-            # Check if there are any databases available
-            existing_dbs = [
-                f
-                for f in os.listdir(DATABASE_FOLDER)
-                if f.endswith(".json") and f != "config.json"
-            ]
-            if existing_dbs:
-                print("\nAvailable databases:")
-                for db in existing_dbs:
-                    print(f"  {db}")
-                print(
-                    "\nUse 'python3 semlist.py activate <database_name>' to activate one of these."
-                )
-            else:
-                print(
-                    "Use 'python3 semlist.py new DatabaseName' to create a new database."
-                )
-            return
-        add_emails(args.args)
 
-    elif command == "rem" and len(args.args) > 0:
-        email = args.args[0]
-        remove_email(email)
+def _cmd_stat(args):
+    """`stat` command: Show detailed statistics about the database."""
+    show_statistics()
 
-    elif command == "new" and len(args.args) > 0:
-        name = args.args[0]
-        create_new_database(name)
 
-    elif command == "del" and len(args.args) > 0:
-        name = args.args[0]
-        delete_database(name)
+def _cmd_check(args):
+    """`check` command: Check emails matching a regex pattern."""
+    if not args.args:
+        _usage_error("Error: 'check' command requires a regex pattern.", __doc__.strip())
+    pattern = " ".join(args.args)  # Join args in case pattern has spaces
+    check_emails(pattern)
 
-    elif command == "activate" and len(args.args) > 0:
-        name = args.args[0]
-        activate_database(name)
 
-    elif command == "optimize":
+def _cmd_add(args):
+    """`add` command: Add email entries to the active database."""
+    if not args.args:
+        _invalid_command()
+    # Check if the default database exists, if not, inform user to create one
+    active_db = get_active_database_path()
+    if not os.path.exists(active_db):
+        print(f"Error: Active database file '{active_db}' does not exist.")
+
+        # Check if there are any databases available
+        if not _print_available_databases():
+            print("Use 'python3 semlist.py new DatabaseName' to create a new database.")
+        return
+    if args.args == ["-"]:
+        # Read every entry from stdin so that a whole list is added with one
+        # journal write instead of one command (and write) per address
+        add_emails([";".join(sys.stdin.read().splitlines())])
+        return
+    add_emails(args.args)
+
+
+def _cmd_rem(args):
+    """`rem` command: Remove an email address from the database."""
+    if not args.args:
+        _invalid_command()
+    remove_email(args.args[0])
+
+
+def _cmd_new(args):
+    """`new` command: Create a new database."""
+    if not args.args:
+        _invalid_command()
+    create_new_database(args.args[0])
+
+
+def _cmd_del(args):
+    """`del` command: Delete an existing database."""
+    if not args.args:
+        _invalid_command()
+    delete_database(args.args[0])
+
+
+def _cmd_activate(args):
+    """`activate` command: Activate an existing database."""
+    if not args.args:
+        _invalid_command()
+    activate_database(args.args[0])
+
+
+def _cmd_optimize(args):
+    """`optimize` command: Optimize batches."""
+    if args.args and args.args[0].lower() == "all":
+        optimize_all_databases()
+    else:
         optimize_command()
 
-    elif command == "config":
-        # Display current configuration
-        config = ensure_config_exists()
-        active_db_config = config.get("active_database", "None")
-        print("Current configuration:")
-        print(f"Active database (in config): {active_db_config}")
 
-        active_db_path = get_active_database_path()
-        print(f"Full path being used: {active_db_path}")
+def _cmd_compact(args):
+    """`compact` command: Store the database as compact JSON."""
+    set_storage_format(True)
 
-        if os.path.exists(active_db_path):
-            print("Database exists: Yes")
-        else:
-            print("Database exists: No - File not found")
 
-            # List available databases
-            existing_dbs = [
-                f
-                for f in os.listdir(DATABASE_FOLDER)
-                if f.endswith(".json") and f != "config.json"
-            ]
-            if existing_dbs:
-                print("\nAvailable databases:")
-                for db in existing_dbs:
-                    print(f"  {db}")
-                print(
-                    "\nUse 'python3 semlist.py activate <database_name>' to activate one of these."
-                )
+def _cmd_prettify(args):
+    """`prettify` command: Store the database as indented JSON."""
+    set_storage_format(False)
+
+
+def _cmd_config(args):
+    """`config` command: Show the current configuration."""
+    # Display current configuration
+    config = ensure_config_exists()
+    active_db_config = config.get("active_database", "None")
+    print("Current configuration:")
+    print(f"Active database (in config): {active_db_config}")
 
+    active_db_path = get_active_database_path()
+    print(f"Full path being used: {active_db_path}")
+
+    if os.path.exists(active_db_path):
+        print("Database exists: Yes")
     else:
-        print("Invalid command or missing arguments.")
-        print("Use 'python3 semlist.py help' for usage information.")
+        print("Database exists: No - File not found")
+
+        # List available databases
+        _print_available_databases()
+
+
+# Command name -> handler taking the parsed arguments.
+COMMANDS = {
+    "print": _cmd_print,
+    "batches": _cmd_batches,
+    "stat": _cmd_stat,
+    "check": _cmd_check,
+    "add": _cmd_add,
+    "rem": _cmd_rem,
+    "new": _cmd_new,
+    "del": _cmd_del,
+    "activate": _cmd_activate,
+    "optimize": _cmd_optimize,
+    "compact": _cmd_compact,
+    "prettify": _cmd_prettify,
+    "config": _cmd_config,
+}
+
+
+def main():
+    """Main entry point of the script."""
+    args = parse_arguments()
+    handler = COMMANDS.get(args.command.lower())
+    if handler is None:
+        _invalid_command()
+    handler(args)
 
 
 if __name__ == "__main__":
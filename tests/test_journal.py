@@ -0,0 +1,77 @@
+"""Regression checks for the add/rem journal kept next to each database."""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import semlist  # noqa: E402
+
+
+class JournalTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "Test.json")
+        semlist.write_json_file(
+            self.path,
+            {"name": "Test", "created": "", "last_modified": "", "batches": []},
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_quietly(self, func, *args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = func(*args)
+        return result, output.getvalue()
+
+    def emails(self):
+        data, _ = self.run_quietly(semlist.read_mailing_list, self.path)
+        return [entry["email"] for entry in semlist.iter_all_emails(data)]
+
+    def test_append_after_interrupted_append(self):
+        self.run_quietly(semlist.add_emails, ["a@example.com"], self.path)
+        # An append cut short leaves a partial record without its newline
+        with open(semlist.journal_path(self.path), "ab") as f:
+            f.write(b'{"op":"add","da')
+        self.run_quietly(semlist.add_emails, ["b@example.com"], self.path)
+
+        self.assertEqual(self.emails(), ["a@example.com", "b@example.com"])
+        with open(semlist.journal_path(self.path), "rb") as f:
+            self.assertNotIn(b'"da{', f.read())
+
+    def test_unreadable_record_is_skipped(self):
+        self.run_quietly(semlist.add_emails, ["a@example.com"], self.path)
+        with open(semlist.journal_path(self.path), "ab") as f:
+            f.write(b"not json\n")
+        self.run_quietly(semlist.add_emails, ["b@example.com"], self.path)
+
+        data, output = self.run_quietly(semlist.read_mailing_list, self.path)
+        self.assertIn("Warning: skipping an unreadable record", output)
+        self.assertEqual(
+            [entry["email"] for entry in semlist.iter_all_emails(data)],
+            ["a@example.com", "b@example.com"],
+        )
+
+    def test_failed_append_reports_no_additions(self):
+        append_to_journal = semlist.append_to_journal
+        semlist.append_to_journal = lambda records, database_path=None: False
+        try:
+            result, output = self.run_quietly(
+                semlist.add_emails, ["a@example.com"], self.path
+            )
+        finally:
+            semlist.append_to_journal = append_to_journal
+
+        self.assertFalse(result)
+        self.assertNotIn("Successfully added", output)
+        self.assertEqual(self.emails(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Checks for applying several changes through one DatabaseSession."""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import semlist  # noqa: E402
+
+
+class SessionTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "Test.json")
+        semlist.write_json_file(
+            self.path,
+            {"name": "Test", "created": "", "last_modified": "", "batches": []},
+        )
+        self.quiet = contextlib.redirect_stdout(io.StringIO())
+        self.quiet.__enter__()
+
+    def tearDown(self):
+        self.quiet.__exit__(None, None, None)
+        self.tmpdir.cleanup()
+
+    def emails(self):
+        data = semlist.read_mailing_list(self.path)
+        return [entry["email"] for entry in semlist.iter_all_emails(data)]
+
+    def test_changes_are_written_once_on_exit(self):
+        semlist.add_emails(["a@example.com"], self.path)  # journaled
+        with semlist.DatabaseSession(self.path) as session:
+            semlist.add_emails(["b@example.com; c@example.com"], session=session)
+            semlist.remove_email("a@example.com", session=session)
+            semlist.optimize_command(session=session)
+            # Nothing reaches the file before the session closes
+            self.assertEqual(self.emails(), ["a@example.com"])
+
+        self.assertTrue(session.saved)
+        self.assertEqual(self.emails(), ["b@example.com", "c@example.com"])
+        self.assertFalse(os.path.exists(semlist.journal_path(self.path)))
+
+    def test_nothing_is_written_after_an_exception(self):
+        with self.assertRaises(RuntimeError):
+            with semlist.DatabaseSession(self.path) as session:
+                semlist.add_emails(["a@example.com"], session=session)
+                raise RuntimeError
+        self.assertEqual(self.emails(), [])
+
+    def test_open_db_writes_the_edited_data(self):
+        with semlist.open_db(self.path) as data:
+            semlist.place_entries(
+                data, [semlist.format_new_entry({"email": "a@example.com"})]
+            )
+        self.assertEqual(self.emails(), ["a@example.com"])
+
+
+if __name__ == "__main__":
+    unittest.main()